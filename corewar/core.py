@@ -23,12 +23,17 @@ class Core(object):
             raise ValueError("Core size must be divisible by width")
         self.write_limit = write_limit if write_limit else self.size
         self.read_limit = read_limit if read_limit else self.size
+        self._grid = None
         self.clear(initial_instruction)
 
     def clear(self, instruction=DEFAULT_INITIAL_INSTRUCTION):
         """Writes the same instruction thorough the entire core.
         """
-        self.instructions = [instruction.core_binded(self) for i in range(self.size)]
+        # Bind once, then fill the core with plain copies of the bound
+        # instruction. Every cell needs its own object, as the MARS modifies
+        # instructions in place.
+        copy_binded = instruction.core_binded(self).__copy__
+        self.instructions = [copy_binded() for i in range(self.size)]
 
     def normalize_point(self, point):
         """Normalize a point's coordinates to be within the core's size on each axis. This ensures arithmetic compliant to ICWS"""
@@ -38,30 +43,35 @@ class Core(object):
             raise ValueError("Point2D expected, got %s" % type(point))
         #if point.x != point.x % self.size or point.y != point.y % self.size:
         #    print(f"normalize_point: {point} -> {Point2D(point.x % self.size, point.y % self.size)}")
-        return Point2D(point.x % self.size, point.y % self.size)
+        size = self.size
+        x, y = point.x, point.y
+        if 0 <= x < size and 0 <= y < size:
+            return point
+        return Point2D.get(x % size, y % size)
             
     def point_to_grid(self, point):
         """Convert a Point2D to 2D grid range, handling 2D wrapping."""
-        # For 2D addressing, handle both x and y wrapping
-        round_x = point.x // self.width    # how many times you wrapped in x
-        x_new  = point.x % self.width
-
-        raw_y = point.y + round_x
-        round_y = point.y // self.height # how many times you wrapped in y
-        final_y = raw_y % self.height
-
-        final_x = (x_new + round_y) % self.width
-        #print(f"point_to_grid: {point} -> {Point2D(final_x, final_y)}")
-        return Point2D(final_x, final_y)
+        if self._grid is None:
+            # There are only size distinct grid points; build them on first
+            # use and hand out the shared instances afterwards
+            width = self.width
+            self._grid = tuple(Point2D(i % width, i // width)
+                               for i in range(self.size))
+        return self._grid[self.point_to_index(point)]
 
     def point_to_index(self, point):
         if not isinstance(point, Point2D):
             import traceback
             traceback.print_stack()
             raise ValueError("Point2D expected, got %s" % type(point))
-            
-        ongrid = self.point_to_grid(point)
-        return ongrid.y * self.width + ongrid.x
+
+        # Same wrapping as point_to_grid, without building the grid point
+        width = self.width
+        height = self.height
+        x, y = point.x, point.y
+        final_y = (y + x // width) % height
+        final_x = (x % width + y // height) % width
+        return final_y * width + final_x
 
     def trim(self, value):
         "Return a trimmed value to the bounds of the core size"
@@ -2,7 +2,6 @@
 # coding: utf-8
 
 from collections import deque
-from copy import copy
 import operator
 from random import randint
 
@@ -33,6 +32,9 @@ EVENT_B_ARITH  = 12
 EVENT_ENERGY_EXHAUSTED = 13
 
 
+# Shared offset of immediate operands
+_ORIGIN = Point2D(0)
+
 
 class MARS(object):
     """The MARS. Encapsulates a simulation.
@@ -54,7 +56,8 @@ class MARS(object):
 
     def get_instruction(self, point):
         """Get instruction at Point2D coordinates."""
-        return self.core[point]
+        core = self.core
+        return core.instructions[core.point_to_index(point)]
 
     def set_instruction(self, point, instruction):
         """Set instruction at Point2D coordinates."""
@@ -69,7 +72,8 @@ class MARS(object):
         #instruction.a_number = self.core.normalize_point(instruction.a_number)
         #instruction.b_number = self.core.normalize_point(instruction.b_number)
         
-        self.core[point] = instruction
+        core = self.core
+        core.instructions[core.point_to_index(point)] = instruction
 
     def core_event(self, warrior, address : Point2D, event_type):
         """Supposed to be implemented by subclasses to handle core
@@ -131,7 +135,7 @@ class MARS(object):
                 abs_pos = Point2D(abs_x, abs_y)
                 
                 # Create a copy of the instruction with warrior's energy
-                instruction_copy = copy(instruction)
+                instruction_copy = instruction.core_binded(self.core)
                 if self.energy_mode:
                     instruction_copy.energy = warrior_energy
                 
@@ -146,8 +150,10 @@ class MARS(object):
         if len(warrior.task_queue) < self.max_processes:
             if not isinstance(point, Point2D):
                 raise ValueError(f"point must be a Point2D, got {type(point)}")
-            # Handle negative addresses by wrapping them to positive
-            point = self.core.trim(point)
+            # Handle negative addresses by wrapping them to positive. Calls
+            # normalize_point directly rather than through Core.trim, as
+            # this runs for every executed instruction.
+            point = self.core.normalize_point(point)
             warrior.task_queue.append(point)
 
     def __iter__(self):
@@ -170,7 +176,6 @@ class MARS(object):
         Returns:
             Point2D: New incremented point
         """
-        print(f"stepping: {stepping}, amount: {amount}, point: {point}")
         if stepping == STEP_NORMAL:
             return Point2D(point.x + amount, point.y)
         elif stepping == STEP_VERTICAL:
@@ -185,13 +190,16 @@ class MARS(object):
     def evaluate_operand(self, pc, number, mode, stepping, warrior):
         """Evaluate an operand (A or B) and return (read_point, write_point, pip_point)."""
         if mode == IMMEDIATE:
-            return Point2D(0), Point2D(0), None
+            return _ORIGIN, _ORIGIN, None
         else:
-            read_point = write_point = Point2D(number)
+            # Points are immutable, so the field value can be used as is
+            if type(number) is not Point2D:
+                number = Point2D(number)
+            read_point = write_point = number
             pip_point = None
 
             if mode != DIRECT:
-                pip_point = Point2D(pc.x + write_point.x, pc.y + write_point.y)
+                pip_point = pc + write_point
 
                 # pre-decrement, if needed
                 if mode == PREDEC_A:
@@ -204,12 +212,15 @@ class MARS(object):
                     self.core_event(warrior, pip_point, EVENT_B_DEC)
 
                 # calculate the indirect address
+                # (the offset's x is added as a plain int and its y is taken
+                # over, without building an intermediate Point2D). Read and
+                # write pointers start out equal and nothing changes the core
+                # in between, so the address is resolved once for both.
                 if mode in (PREDEC_A, INDIRECT_A, POSTINC_A):
-                    read_point = Point2D(read_point.x + self.get_instruction(Point2D(pc.x + read_point.x, pc.y + read_point.y)).a_number, 0)
-                    write_point = Point2D(write_point.x + self.get_instruction(Point2D(pc.x + write_point.x, pc.y + write_point.y)).a_number, 0)
+                    offset = self.get_instruction(pip_point).a_number
                 else: # B modes
-                    read_point = Point2D(read_point.x + self.get_instruction(Point2D(pc.x + read_point.x, pc.y + read_point.y)).b_number, 0)
-                    write_point = Point2D(write_point.x + self.get_instruction(Point2D(pc.x + write_point.x, pc.y + write_point.y)).b_number, 0)
+                    offset = self.get_instruction(pip_point).b_number
+                read_point = write_point = Point2D(number.x + offset.x, offset.y)
 
                 # post-increment is performed after operation by helper handle_post_increment()
 
@@ -246,7 +257,7 @@ class MARS(object):
         elif ir.opcode == MOD:
             self.do_arithmetic(warrior, pc, ir, ira, irb, rpa, rpb, wpb, operator.mod)
         elif ir.opcode == JMP:
-            self.enqueue(warrior, Point2D(pc.x + rpa.x, pc.y + rpa.y))
+            self.enqueue(warrior, pc + rpa)
         elif ir.opcode == JMZ:
             self.execute_jmz(warrior, pc, ir, irb, rpa)
         elif ir.opcode == JMN:
@@ -255,7 +266,7 @@ class MARS(object):
             self.execute_djn(warrior, pc, ir, irb, rpa, wpb)
         elif ir.opcode == SPL:
             self.enqueue(warrior, self.increment_by_stepping(pc, 1, ir.stepping))
-            self.enqueue(warrior, Point2D(pc.x + rpa.x, pc.y + rpa.y))
+            self.enqueue(warrior, pc + rpa)
         elif ir.opcode == SLT:
             self.do_comparison(warrior, pc, ir, ira, irb, rpa, rpb, operator.lt)
         elif ir.opcode == CMP or ir.opcode == SEQ:
@@ -273,9 +284,9 @@ class MARS(object):
 
     def execute_mov(self, warrior, pc, ir, ira, rpa, wpb):
         """Execute a MOV instruction."""
-        target_point = Point2D(pc.x + wpb.x, pc.y + wpb.y)
+        target_point = pc + wpb
         target_instruction = self.get_instruction(target_point)
-        rpa_point = Point2D(pc.x + rpa.x, pc.y + rpa.y)
+        rpa_point = pc + rpa
 
         # Move energy between instructions if in energy mode
         if self.energy_mode:
@@ -322,7 +333,7 @@ class MARS(object):
 
     def execute_jmz(self, warrior, pc, ir, irb, rpa):
         """Execute a JMZ instruction."""
-        rpa_point = Point2D(pc.x + rpa.x, pc.y + rpa.y)
+        rpa_point = pc + rpa
         next_point = self.increment_by_stepping(pc, 1, ir.stepping)
 
         if ir.modifier == M_A or ir.modifier == M_BA:
@@ -340,7 +351,7 @@ class MARS(object):
 
     def execute_jmn(self, warrior, pc, ir, irb, rpa):
         """Execute a JMN instruction."""
-        rpa_point = Point2D(pc.x + rpa.x, pc.y + rpa.y)
+        rpa_point = pc + rpa
         next_point = self.increment_by_stepping(pc, 1, ir.stepping)
 
         if ir.modifier == M_A or ir.modifier == M_BA:
@@ -358,8 +369,8 @@ class MARS(object):
 
     def execute_djn(self, warrior, pc, ir, irb, rpa, wpb):
         """Execute a DJN instruction."""
-        target_point = Point2D(pc.x + wpb.x, pc.y + wpb.y)
-        rpa_point = Point2D(pc.x + rpa.x, pc.y + rpa.y)
+        target_point = pc + wpb
+        rpa_point = pc + rpa
         next_point = self.increment_by_stepping(pc, 1, ir.stepping)
 
         if ir.modifier == M_A or ir.modifier == M_BA:
@@ -390,10 +401,11 @@ class MARS(object):
     def step(self):
         """Run one simulation step: execute one task of every active warrior."""
         for warrior in self.warriors:
-            if warrior.task_queue:
+            task_queue = warrior.task_queue
+            if task_queue:
                 # The process counter is the next instruction-address in the
                 # warrior's task queue
-                pc = warrior.task_queue.pop(0)
+                pc = task_queue.popleft()
                 #print(f"pc: {pc}")
                 if not isinstance(pc, Point2D):
                     raise ValueError("Invalid process counter: %s" % pc)
@@ -402,38 +414,48 @@ class MARS(object):
                 ir = self.get_instruction(pc)
 
                 # Consume energy if in energy mode
-                print(f"energy_mode: {self.energy_mode}, instruction: {ir}")
-
                 if self.energy_mode:
                     if not ir.consume_energy():
-                        print(f"exhausted energy, instruction: {ir}")
                         self.core_event(warrior, pc, EVENT_ENERGY_EXHAUSTED)
                         continue  # Skip execution if not enough energy
 
                 # copy the current instruction to the instruction register
-                ir = copy(ir)
+                # (calling __copy__ directly skips copy()'s generic dispatch)
+                ir = ir.__copy__()
 
                 # evaluate the A-operand
                 rpa, wpa, pip_a = self.evaluate_operand(pc, ir.a_number, ir.a_mode, ir.stepping, warrior)
-                ira = copy(self.get_instruction(Point2D(pc.x + rpa.x, pc.y + rpa.y)))
+                ira = self.get_instruction(pc + rpa).__copy__()
                 self.handle_post_increment(pip_a, ir.a_mode, ir.stepping, warrior)
 
                 # evaluate the B-operand
                 rpb, wpb, pip_b = self.evaluate_operand(pc, ir.b_number, ir.b_mode, ir.stepping, warrior)
-                irb = copy(self.get_instruction(Point2D(pc.x + rpb.x, pc.y + rpb.y)))
+                irb = self.get_instruction(pc + rpb).__copy__()
                 self.handle_post_increment(pip_b, ir.b_mode, ir.stepping, warrior)
 
                 self.core_event(warrior, pc, EVENT_EXECUTED)
                 self.execute_instruction(warrior, pc, ir, ira, irb, rpa, rpb, wpb)
 
+    def step_many(self, n):
+        """Run up to n simulation steps, stopping early once no warrior has
+           tasks left. Returns the number of steps run.
+        """
+        step = self.step
+        warriors = self.warriors
+        for i in range(n):
+            if not any(warrior.task_queue for warrior in warriors):
+                return i
+            step()
+        return n
+
     def do_arithmetic(self, warrior, pc, ir, ira, irb, rpa, rpb, wpb, op):
         """Execute arithmetic operations (ADD, SUB, MUL, DIV, MOD)."""
         try:
             # Pre-calculate common points and instructions
-            target_point = Point2D(pc.x + wpb.x, pc.y + wpb.y)
+            target_point = pc + wpb
             target_instruction = self.get_instruction(target_point)
-            rpa_point = Point2D(pc.x + rpa.x, pc.y + rpa.y)
-            rpb_point = Point2D(pc.x + rpb.x, pc.y + rpb.y)
+            rpa_point = pc + rpa
+            rpb_point = pc + rpb
 
             if ir.modifier == M_A:
                 target_instruction.a_number = self.normalize(op(irb.a_number, ira.a_number))
@@ -484,8 +506,8 @@ class MARS(object):
     def do_comparison(self, warrior, pc, ir, ira, irb, rpa, rpb, cmp):
         """Execute comparison operations (SLT, CMP/SEQ, SNE)."""
         # Pre-calculate common points
-        rpa_point = Point2D(pc.x + rpa.x, pc.y + rpa.y)
-        rpb_point = Point2D(pc.x + rpb.x, pc.y + rpb.y)
+        rpa_point = pc + rpa
+        rpb_point = pc + rpb
         next_point = self.increment_by_stepping(pc, 1, ir.stepping)
         jump_point = self.increment_by_stepping(pc, 2, ir.stepping)
 
@@ -56,7 +56,7 @@ class MARSREPL(MARS):
 
 def parse_point2d(point_str):
     """Parse a Point2D string, accepting either a single number or x:y format."""
-    return Point2D(point_str, 0)
+    return Point2D.parse(point_str)
 
 def handle_step_command(mars, warrior):
     """Handle the step command."""
@@ -66,7 +66,7 @@ def handle_step_command(mars, warrior):
     mars.step()
     if warrior.task_queue:
         if len(warrior.task_queue) > 1:
-            print(f"Next positions: {warrior.task_queue}")
+            print(f"Next positions: {list(warrior.task_queue)}")
     else:
         print("Process terminated")
 
@@ -188,7 +188,7 @@ def handle_instruction(line, mars, warrior):
         # Show the next position
         if warrior.task_queue:
             if len(warrior.task_queue) > 1:
-                print(f"Next positions: {warrior.task_queue}")
+                print(f"Next positions: {list(warrior.task_queue)}")
         else:
             print("Process terminated")
             
@@ -1,5 +1,6 @@
 from copy import copy
-from random import randint, choices, seed
+from itertools import accumulate
+from random import randint, randrange, choices, seed
 from redcode import (
     DAT, MOV, ADD, SUB, MUL, DIV, MOD, JMP, JMZ, JMN, DJN, SPL, SLT, CMP, SEQ, SNE, NOP,
     M_A, M_B, M_AB, M_BA, M_F, M_X, M_I,
@@ -51,6 +52,14 @@ ADDRESSING_MODE_WEIGHTS = {
     IMMEDIATE: 8, DIRECT: 4, INDIRECT_B: 2, PREDEC_B: 1, POSTINC_B: 1, INDIRECT_A: 2, PREDEC_A: 1, POSTINC_A: 1
 }
 
+# Flattened forms of the weight tables above, for random.choices()
+_MUTATION_TYPES = list(MUTATION_WEIGHTS.keys())
+_MUTATION_CUM_WEIGHTS = list(accumulate(MUTATION_WEIGHTS.values()))
+_OPCODE_CHOICES = list(OPCODE_WEIGHTS.keys())
+_OPCODE_CUM_WEIGHTS = list(accumulate(OPCODE_WEIGHTS.values()))
+_MODE_CHOICES = list(ADDRESSING_MODE_WEIGHTS.keys())
+_MODE_CUM_WEIGHTS = list(accumulate(ADDRESSING_MODE_WEIGHTS.values()))
+
 def mutate_value(value):
     """Mutate a value by adding or subtracting a power of 2.
     
@@ -78,22 +87,22 @@ def mutate_value(value):
     
     return Point2D(new_x, new_y)
 
-def mutate_instruction(instruction):
+def mutate_instruction(instruction, mutation_type=None):
     """Mutate a single instruction by randomly changing one of its fields.
     
     Args:
         instruction: The instruction to mutate
+        mutation_type: Optional key of MUTATION_WEIGHTS naming the field to
+            change; picked at random by weight if not given
         
     Returns:
         Tuple of (mutated_instruction, was_changed) where was_changed is a boolean
         indicating if any field was actually changed
     """
     # Select which field to mutate based on weights
-    mutation_type = choices(
-        list(MUTATION_WEIGHTS.keys()),
-        weights=list(MUTATION_WEIGHTS.values()),
-        k=1
-    )[0]
+    if mutation_type is None:
+        mutation_type = choices(_MUTATION_TYPES,
+                                cum_weights=_MUTATION_CUM_WEIGHTS)[0]
     
     # Create a copy of the instruction to mutate
     mutated = copy(instruction)
@@ -102,11 +111,8 @@ def mutate_instruction(instruction):
     # Apply the selected mutation
     if mutation_type == 'opcode':
         # Use weighted selection for opcodes
-        new_opcode = choices(
-            list(OPCODE_WEIGHTS.keys()),
-            weights=list(OPCODE_WEIGHTS.values()),
-            k=1
-        )[0]
+        new_opcode = choices(_OPCODE_CHOICES,
+                             cum_weights=_OPCODE_CUM_WEIGHTS)[0]
         if new_opcode != instruction.opcode:
             mutated.opcode = new_opcode
             was_changed = True
@@ -122,11 +128,7 @@ def mutate_instruction(instruction):
             was_changed = True
     elif mutation_type == 'a_mode':
         # Use weighted selection for addressing modes
-        new_mode = choices(
-            list(ADDRESSING_MODE_WEIGHTS.keys()),
-            weights=list(ADDRESSING_MODE_WEIGHTS.values()),
-            k=1
-        )[0]
+        new_mode = choices(_MODE_CHOICES, cum_weights=_MODE_CUM_WEIGHTS)[0]
         if new_mode != instruction.a_mode:
             mutated.a_mode = new_mode
             was_changed = True
@@ -137,11 +139,7 @@ def mutate_instruction(instruction):
             was_changed = True
     elif mutation_type == 'b_mode':
         # Use weighted selection for addressing modes
-        new_mode = choices(
-            list(ADDRESSING_MODE_WEIGHTS.keys()),
-            weights=list(ADDRESSING_MODE_WEIGHTS.values()),
-            k=1
-        )[0]
+        new_mode = choices(_MODE_CHOICES, cum_weights=_MODE_CUM_WEIGHTS)[0]
         if new_mode != instruction.b_mode:
             mutated.b_mode = new_mode
             was_changed = True
@@ -168,26 +166,27 @@ def mutate_core(mars, num_mutations=1, seed_value=None):
         seed(seed_value)
     
     mutations_performed = 0
-    attempts = 0
     max_attempts = num_mutations * 2  # Allow some extra attempts to find changes
-    
-    while mutations_performed < num_mutations and attempts < max_attempts:
-        attempts += 1
-        
-        # Select a random position in the core
-        x = randint(0, mars.core.width - 1)
-        y = randint(0, mars.core.height - 1)
-        pos = Point2D(x, y)
-        
-        # Get the instruction at that position
-        instruction = mars.get_instruction(pos)
-        
-        # Mutate the instruction
-        mutated, was_changed = mutate_instruction(instruction)
-        
+
+    # Draw the field to change for every attempt up front, in one call
+    mutation_types = choices(_MUTATION_TYPES,
+                             cum_weights=_MUTATION_CUM_WEIGHTS,
+                             k=max_attempts)
+
+    width = mars.core.width
+    height = mars.core.height
+    for mutation_type in mutation_types:
+        if mutations_performed >= num_mutations:
+            break
+
+        # Select a random cell of the core and mutate its instruction
+        pos = Point2D(randrange(width), randrange(height))
+        mutated, was_changed = mutate_instruction(mars.get_instruction(pos),
+                                                  mutation_type)
+
         # Store the mutated instruction back in the core
         mars.set_instruction(pos, mutated)
         if was_changed:
             mutations_performed += 1
     
-    return mutations_performed 
\ No newline at end of file
+    return mutations_performed 
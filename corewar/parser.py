@@ -1,20 +1,70 @@
-from copy import copy
+from functools import lru_cache
 import re
-from typing import Dict, Set, Tuple, Optional, Iterator
+from typing import Dict, Tuple, Optional, Iterator
 from redcode import (
     Warrior, Instruction, Point2D, OPCODES, MODIFIERS, 
-    STEP_MODIFIERS, MODES, INSTRUCTION_REGEX, STEP_NORMAL,
+    STEP_MODIFIERS, MODES, OPCODES_CI, MODIFIERS_CI, STEP_MODIFIERS_CI, INSTRUCTION_REGEX, STEP_NORMAL,
     STEP_VERTICAL, STEP_BACKWARD, STEP_VERTICAL_BACKWARD,
     DAT, IMMEDIATE, DIRECT
 )
 
+@lru_cache(maxsize=4096)
+def _tokenize_instruction(line: str) -> Optional[Tuple[Optional[str], ...]]:
+    """Split an instruction into its (opcode, modifier, stepping, a_mode,
+       a_number, b_mode, b_number) strings, or None if it does not match.
+       Cached, since warriors and step logs repeat the same lines a lot."""
+    m = INSTRUCTION_REGEX.match(line)
+    return m.groups() if m else None
+
+@lru_cache(maxsize=1024)
+def _compile_expression(expression: str):
+    """Compile a Redcode expression (operand, EQU value, ;assert or start)
+       once for every line and warrior using it."""
+    return compile(expression.strip(), '<redcode>', 'eval')
+
+def _point_value(value) -> Point2D:
+    """Convert an evaluated operand to a Point2D, sharing the instances of
+       small int values."""
+    if type(value) is int:
+        return Point2D.get(value)
+    return Point2D(value)
+
+# Offset from an instruction's position to the next one, by the stepping
+# modifier as written in the source (None when it is left out)
+_STEP_OFFSETS = {
+    STEP_NORMAL: (1, 0),
+    STEP_VERTICAL: (0, 1),
+    STEP_BACKWARD: (-1, 0),
+    STEP_VERTICAL_BACKWARD: (0, -1),
+}
+_POSITION_STEPS = {name: _STEP_OFFSETS[value]
+                   for name, value in STEP_MODIFIERS_CI.items()}
+_POSITION_STEPS[None] = _STEP_OFFSETS[STEP_NORMAL]
+
+class RelativeLabels:
+    """Read-only mapping of label names to their offsets from a position.
+
+       Passed as the locals of eval() in the second pass; the position is
+       updated per instruction and offsets are only computed for the labels
+       an expression actually uses.
+    """
+    __slots__ = ('labels', 'x', 'y')
+
+    def __init__(self, labels: Dict[str, Point2D], x: int = 0, y: int = 0):
+        self.labels = labels
+        self.x = x
+        self.y = y
+
+    def __getitem__(self, name: str) -> Point2D:
+        address = self.labels[name]
+        return Point2D.get(address.x - self.x, address.y - self.y)
+
 class Parser:
     def __init__(self, definitions: Dict = None):
         self.definitions = definitions or {}
         self.labels: Dict[str, Point2D] = {}
-        self.current_pos = Point2D(0, 0)
-        self.used_positions: Set[Point2D] = set()
-        self.environment = copy(self.definitions)
+        self.current_pos = Point2D.get(0, 0)
+        self.environment = dict(self.definitions)
         self.found_redcode_info = False
         self._last_energy = None
 
@@ -23,18 +73,13 @@ class Parser:
         warrior = Warrior()
         warrior.strategy = []
 
-        for n, line in enumerate(input_lines):
+        for n, line in enumerate(self._read_lines(input_lines)):
             line = line.strip()
             if not line:
                 continue
 
-            if self._handle_redcode_info(line, warrior, n):
-                continue
-
-            if self._handle_metadata(line, warrior):
-                continue
-
-            if self._handle_assert(line, n):
+            # Only lines starting with ';' can be directive comments
+            if line[0] == ';' and self._handle_meta(line, warrior, n):
                 continue
 
             # Remove comments
@@ -42,14 +87,14 @@ class Parser:
             if not line:
                 continue
 
-            if self._handle_org(line, warrior):
-                continue
-
-            if self._handle_end(line, warrior):
-                break
-
-            if self._handle_equ(line):
-                continue
+            # ORG/END lines start with an 'o' or 'e' and EQU lines contain a
+            # 'q'; any other line can skip the directive match
+            if line[0] in 'oOeE' or 'q' in line or 'Q' in line:
+                m = _DIRECTIVE_RE.match(line)
+                if m:
+                    if self._handle_directive(m, warrior):
+                        break
+                    continue
 
             # Handle labels and instruction
             line = self._handle_labels(line)
@@ -65,114 +110,102 @@ class Parser:
         
         return warrior
 
-    def _handle_redcode_info(self, line: str, warrior: Warrior, line_num: int) -> bool:
-        """Handle ;redcode info comment."""
-        m = re.match(r'^;redcode\w*$', line, re.I)
-        if m:
-            if self.found_redcode_info:
-                return True  # Stop reading
-            else:
-                # Reset state for first ;redcode
-                warrior.instructions = {}
-                self.labels = {}
-                self.environment = copy(self.definitions)
-                self.current_pos = Point2D(0, 0)
-                self.used_positions = set()
-                self.found_redcode_info = True
+    def _read_lines(self, input_lines) -> list:
+        """Materialize the input once: file-like objects are read in a single
+           call and split, strings are split into lines, other iterables of
+           lines are turned into a list.
+        """
+        if hasattr(input_lines, 'read'):
+            return input_lines.read().split('\n')
+        if isinstance(input_lines, str):
+            return input_lines.split('\n')
+        return list(input_lines)
+
+    def _handle_meta(self, line: str, warrior: Warrior, line_num: int) -> bool:
+        """Handle the ;redcode, ;name, ;author, ;date, ;version, ;strategy and
+           ;assert comments with a single match, dispatching on the keyword."""
+        m = _META_RE.match(line)
+        if not m:
+            return False
+        keyword, value = m.groups()
+        keyword = keyword.lower()
+        if keyword.startswith('redcode'):
+            if value is not None:
+                return False
+            self._handle_redcode_info(warrior)
             return True
-        return False
-
-    def _handle_metadata(self, line: str, warrior: Warrior) -> bool:
-        """Handle metadata comments (name, author, etc.)."""
-        metadata_patterns = {
-            r'^;name\s+(.+)$': ('name', str),
-            r'^;author\s+(.+)$': ('author', str),
-            r'^;date\s+(.+)$': ('date', str),
-            r'^;version\s+(.+)$': ('version', str),
-            r'^;strat(?:egy)?\s+(.+)$': ('strategy', list)
-        }
-
-        for pattern, (attr, type_) in metadata_patterns.items():
-            m = re.match(pattern, line, re.I)
-            if m:
-                value = m.group(1).strip()
-                if type_ == list:
-                    getattr(warrior, attr).append(value)
-                else:
-                    setattr(warrior, attr, value)
-                return True
-        return False
+        if value is None:
+            return False
+        _META_HANDLERS[keyword](self, warrior, value.strip(), line_num)
+        return True
 
-    def _handle_assert(self, line: str, line_num: int) -> bool:
+    def _handle_redcode_info(self, warrior: Warrior) -> None:
+        """Handle ;redcode info comment."""
+        if not self.found_redcode_info:
+            # Reset state for first ;redcode
+            warrior.instructions = {}
+            self.labels = {}
+            self.environment = dict(self.definitions)
+            self.current_pos = Point2D.get(0, 0)
+            self.found_redcode_info = True
+
+    def _handle_assert(self, warrior: Warrior, expression: str, line_num: int) -> None:
         """Handle assert expressions."""
-        m = re.match(r'^;assert\s+(.+)$', line, re.I)
-        if m:
-            if not eval(m.group(1), self.environment):
-                raise AssertionError(f"Assertion failed: {line}, line {line_num}")
-            return True
-        return False
+        if not eval(_compile_expression(expression), self.environment):
+            raise AssertionError(f"Assertion failed: ;assert {expression}, line {line_num}")
 
     def _strip_comments(self, line: str) -> str:
         """Remove comments from a line."""
-        # First check for energy value in comment
-        energy_match = re.match(r'^([^;]*)\s*;\s*E:(\d+)\s*(?:;.*)?$', line)
-        if energy_match:
-            line = energy_match.group(1).strip()
-            self._last_energy = int(energy_match.group(2))
+        if ';' not in line:
             return line
+
+        # First check for energy value in comment. Only lines containing
+        # 'E:' can match, so plain comments skip the regex.
+        if 'E:' in line:
+            energy_match = _ENERGY_COMMENT_RE.match(line)
+            if energy_match:
+                line = energy_match.group(1).strip()
+                self._last_energy = int(energy_match.group(2))
+                return line
             
         # Then handle regular comments
-        m = re.match(r'^([^;]*)\s*;', line)
-        if m:
-            line = m.group(1).strip()
-        return line
-
-    def _handle_org(self, line: str, warrior: Warrior) -> bool:
-        """Handle ORG directive."""
-        m = re.match(r'^ORG\s+(.+)\s*$', line, re.I)
-        if m:
-            warrior.start = m.group(1)
-            return True
-        return False
-
-    def _handle_end(self, line: str, warrior: Warrior) -> bool:
-        """Handle END directive."""
-        m = re.match(r'^END(?:\s+([^\s]+))?$', line, re.I)
-        if m:
-            if m.group(1):
-                warrior.start = m.group(1)
-            return True
-        return False
-
-    def _handle_equ(self, line: str) -> bool:
-        """Handle EQU directive."""
-        m = re.match(r'^([a-z]\w*)\s+EQU\s+(.*)\s*$', line, re.I)
-        if m:
-            name, value = m.groups()
-            self.environment[name] = eval(value, self.environment)
+        return line[:line.index(';')].strip()
+
+    def _handle_directive(self, m, warrior: Warrior) -> bool:
+        """Handle a matched ORG, END or EQU directive. Returns True on END."""
+        if m.group('org') is not None:
+            warrior.start = m.group('org')
+        elif m.group('end') is not None:
+            if m.group('end_start'):
+                warrior.start = m.group('end_start')
             return True
+        else:
+            self.environment[m.group('equ')] = eval(_compile_expression(m.group('value')), self.environment)
         return False
 
     def _handle_labels(self, line: str) -> str:
         """Handle labels and return remaining line."""
         while True:
-            m = re.match(r'^([a-z]\w*)\s+(.+)\s*$', line)
-            if m:
-                label_candidate = m.group(1)
-                if label_candidate.upper() not in OPCODES:
-                    self.labels[label_candidate] = self.current_pos
-                    line = m.group(2)
-                    continue
-            break
+            parts = line.split(None, 1)
+            if len(parts) < 2:
+                break
+            label_candidate = parts[0]
+            # Labels start with a lowercase letter followed by word characters
+            if not ('a' <= label_candidate[0] <= 'z' and label_candidate.isidentifier()):
+                break
+            if label_candidate in OPCODES_CI or label_candidate.upper() in OPCODES:
+                break
+            self.labels[label_candidate] = self.current_pos
+            line = parts[1]
         return line
 
     def _parse_instruction(self, line: str, warrior: Warrior, line_num: int) -> None:
         """Parse a single instruction."""
-        m = INSTRUCTION_REGEX.match(line)
-        if not m:
+        tokens = _tokenize_instruction(line)
+        if tokens is None:
             raise ValueError(f'Error at line {line_num}: expected instruction in expression: "{line}"')
 
-        opcode, modifier, stepping, a_mode, a_number, b_mode, b_number = m.groups()
+        opcode, modifier, stepping, a_mode, a_number, b_mode, b_number = tokens
         
         self._validate_instruction_components(opcode, modifier, stepping, line_num)
         
@@ -186,7 +219,7 @@ class Parser:
             print(f"  b_mode:   {b_mode}")
             print(f"  b_number: {b_number}")
 
-        if self.current_pos in self.used_positions:
+        if self.current_pos in warrior.instructions:
             raise ValueError(f'Error at line {line_num}: instruction position {self.current_pos} already used')
 
         # Parse values
@@ -203,58 +236,82 @@ class Parser:
             energy=energy_value
         )
         warrior.instructions[self.current_pos] = instruction
-        self.used_positions.add(self.current_pos)
 
         # Update position based on stepping
         self._update_position(stepping)
 
-    def _validate_instruction_components(self, opcode: str, modifier: str, stepping: str, line_num: int) -> None:
+    def _validate_instruction_components(self, opcode: str, modifier: Optional[str], stepping: Optional[str], line_num: int) -> None:
         """Validate instruction components."""
-        if opcode.upper() not in OPCODES:
+        if opcode not in OPCODES_CI and opcode.upper() not in OPCODES:
             raise ValueError(f'Invalid opcode: {opcode} in line {line_num}')
-        if modifier is not None and modifier.upper() not in MODIFIERS:
+        if modifier is not None and modifier not in MODIFIERS_CI and modifier.upper() not in MODIFIERS:
             raise ValueError(f'Invalid modifier: {modifier} in line {line_num}')
-        if stepping is not None and stepping.upper() not in STEP_MODIFIERS:
+        if stepping is not None and stepping not in STEP_MODIFIERS_CI and stepping.upper() not in STEP_MODIFIERS:
             raise ValueError(f'Invalid stepping modifier: {stepping} in line {line_num}')
 
     def _parse_number(self, value: Optional[str]) -> Point2D:
-        """Parse a number value into Point2D."""
+        """Parse a number value into Point2D. Symbolic expressions are kept as
+           strings and evaluated in the second pass."""
+        if value is None:
+            return None
         try:
-            return Point2D(value)
-        except:
+            return Point2D.parse(value)
+        except ValueError:
             return value
 
     def _update_position(self, stepping: Optional[str]) -> None:
         """Update current position based on stepping mode."""
-        stepping_mode = STEP_MODIFIERS[stepping.upper()] if stepping else STEP_NORMAL
-        if stepping_mode == STEP_NORMAL:
-            self.current_pos = Point2D(self.current_pos.x + 1, self.current_pos.y)
-        elif stepping_mode == STEP_VERTICAL:
-            self.current_pos = Point2D(self.current_pos.x, self.current_pos.y + 1)
-        elif stepping_mode == STEP_BACKWARD:
-            self.current_pos = Point2D(self.current_pos.x - 1, self.current_pos.y)
-        elif stepping_mode == STEP_VERTICAL_BACKWARD:
-            self.current_pos = Point2D(self.current_pos.x, self.current_pos.y - 1)
+        dx, dy = _POSITION_STEPS[stepping]
+        pos = self.current_pos
+        self.current_pos = Point2D.get(pos.x + dx, pos.y + dy)
 
     def _evaluate_start(self, warrior: Warrior) -> None:
         """Evaluate start expression."""
         if isinstance(warrior.start, str):
-            warrior.start = eval(warrior.start, self.environment, self.labels)
+            warrior.start = self._evaluate(warrior.start, self.labels)
         if isinstance(warrior.start, int):
             warrior.start = Point2D(warrior.start, 0)
 
+    def _evaluate(self, expression: str, labels):
+        """Evaluate an operand expression. Plain numbers were already
+           converted in the first pass; bare label names, the most common
+           expression left, are looked up without going through eval()."""
+        expression = expression.strip()
+        if expression in self.labels:
+            return labels[expression]
+        return eval(_compile_expression(expression), self.environment, labels)
+
     def _evaluate_labels(self, warrior: Warrior) -> None:
         """Evaluate labels and expressions in instructions."""
+        relative_labels = RelativeLabels(self.labels)
         for pos, instruction in warrior.instructions.items():
-            relative_labels = {
-                name: Point2D(address.x - pos.x, address.y - pos.y)
-                for name, address in self.labels.items()
-            }
+            relative_labels.x = pos.x
+            relative_labels.y = pos.y
 
             if isinstance(instruction.a_number, str):
-                instruction.a_number = eval(instruction.a_number, self.environment, relative_labels)
+                instruction.a_number = _point_value(self._evaluate(instruction.a_number, relative_labels))
             if isinstance(instruction.b_number, str):
-                instruction.b_number = eval(instruction.b_number, self.environment, relative_labels)
+                instruction.b_number = _point_value(self._evaluate(instruction.b_number, relative_labels))
+
+# ORG, END and EQU; the group that matched tells which directive it is
+_DIRECTIVE_RE = re.compile(r'^(?:ORG\s+(?P<org>.+)'
+                           r'|(?P<end>END)(?:\s+(?P<end_start>[^\s]+))?'
+                           r'|(?P<equ>[a-z]\w*)\s+EQU\s+(?P<value>.*))$', re.I)
+
+_ENERGY_COMMENT_RE = re.compile(r'^([^;]*)\s*;\s*E:(\d+)\s*(?:;.*)?$')
+
+# Matches all ';' directive comments; the keyword selects the handler
+_META_RE = re.compile(r'^;(redcode\w*|name|author|date|version|strat(?:egy)?|assert)(?:\s+(.+))?$', re.I)
+
+_META_HANDLERS = {
+    'name': lambda parser, warrior, value, line_num: setattr(warrior, 'name', value),
+    'author': lambda parser, warrior, value, line_num: setattr(warrior, 'author', value),
+    'date': lambda parser, warrior, value, line_num: setattr(warrior, 'date', value),
+    'version': lambda parser, warrior, value, line_num: setattr(warrior, 'version', value),
+    'strat': lambda parser, warrior, value, line_num: warrior.strategy.append(value),
+    'strategy': lambda parser, warrior, value, line_num: warrior.strategy.append(value),
+    'assert': Parser._handle_assert,
+}
 
 def parse(input_lines: Iterator[str], definitions: Dict = None) -> Warrior:
     """Parse Redcode from a line iterator returning a Warrior object."""
@@ -1,8 +1,9 @@
 #! /usr/bin/env python3
 # coding: utf-8
 
-from copy import copy
 import re
+from collections import deque
+from functools import lru_cache
 
 __all__ = ['parse', 'DAT', 'MOV', 'ADD', 'SUB', 'MUL', 'DIV', 'MOD', 'JMP',
            'JMZ', 'JMN', 'DJN', 'SPL', 'SLT', 'CMP', 'SEQ', 'SNE', 'NOP',
@@ -78,12 +79,13 @@ POSTINC_A = 7   # postincrement indirect using A-field
 MODES = { '#': IMMEDIATE, '$': DIRECT, '@': INDIRECT_B, '<': PREDEC_B,
           '>': POSTINC_B, '*': INDIRECT_A, '{': PREDEC_A, '}': POSTINC_A }
 
-INSTRUCTION_REGEX = re.compile(r'([a-z]{3})'  # opcode
-                               r'(?:\s*\.\s*([abfxi]{1,2}))?' # optional modifier
-                               r'(?:\s*\.\s*([wqsd]))?' # optional stepping modifier
+# Case-insensitive through explicit character classes rather than re.I; the
+# operands are left as written since labels are case-sensitive.
+INSTRUCTION_REGEX = re.compile(r'([a-zA-Z]{3})'  # opcode
+                               r'(?:\s*\.\s*([abfxiABFXI]{1,2}))?' # optional modifier
+                               r'(?:\s*\.\s*([wqsdWQSD]))?' # optional stepping modifier
                                r'(?:\s*([#\$\*@\{<\}>])?\s*([^,$]+))?' # optional first value
-                               r'(?:\s*,\s*([#\$\*@\{<\}>])?\s*([^,]+))?$', # optional second value
-                               re.I)
+                               r'(?:\s*,\s*([#\$\*@\{<\}>])?\s*([^,]+))?$') # optional second value
 
 OPCODES = {'DAT': DAT, 'MOV': MOV, 'ADD': ADD, 'SUB': SUB, 'MUL': MUL,
            'DIV': DIV, 'MOD': MOD, 'JMP': JMP, 'JMZ': JMZ, 'JMN': JMN,
@@ -93,6 +95,53 @@ OPCODES = {'DAT': DAT, 'MOV': MOV, 'ADD': ADD, 'SUB': SUB, 'MUL': MUL,
 MODIFIERS = {'A': M_A, 'B': M_B, 'AB': M_AB, 'BA': M_BA, 'F': M_F, 'X': M_X,
              'I': M_I}
 
+# Inverse tables, used to print instructions
+_OPCODES_INV = {v: k for k, v in OPCODES.items()}
+_MODIFIERS_INV = {v: k for k, v in MODIFIERS.items()}
+# Modes are always valid, so they can be indexed directly by value
+_MODE_CHARS = [k for k, v in sorted(MODES.items(), key=lambda item: item[1])]
+
+# Instruction.__str__ only shows the stepping modifier when it's not the
+# default (D); the padding keeps the operands aligned
+_STEP_SUFFIXES = {v: '.' + k for k, v in STEP_MODIFIERS.items() if k != 'D'}
+_INSTRUCTION_FORMAT = "%s.%-2s%s %s %s, %s %s%s"
+
+def _case_variants(table):
+    "Return a copy of a name table keyed by the upper, lower and title case names"
+    return dict((variant, value) for name, value in table.items()
+                for variant in (name.upper(), name.lower(), name.title()))
+
+# Name tables accepting the usual spellings without re-casing the input
+OPCODES_CI = _case_variants(OPCODES)
+MODIFIERS_CI = _case_variants(MODIFIERS)
+STEP_MODIFIERS_CI = _case_variants(STEP_MODIFIERS)
+
+def _with_values(table):
+    "Return a copy of a name table that also maps each value to itself"
+    resolve = dict(table)
+    resolve.update((value, value) for value in table.values())
+    return resolve
+
+# Tables resolving either a name or an already resolved value, as accepted by
+# Instruction()
+OPCODE_VALUES = _with_values(OPCODES_CI)
+MODIFIER_VALUES = _with_values(MODIFIERS_CI)
+STEP_VALUES = _with_values(STEP_MODIFIERS_CI)
+MODE_VALUES = _with_values(MODES)
+
+def lookup_name(table_ci, name, field='name'):
+    """Look up a name in a case-insensitive table. Only unusually cased
+       names (e.g. 'mOv') pay for an upper() call. Raises ValueError naming
+       the field for anything the table does not know.
+    """
+    value = table_ci.get(name)
+    if value is None:
+        if isinstance(name, str):
+            value = table_ci.get(name.upper())
+        if value is None:
+            raise ValueError("Invalid %s: %r" % (field, name))
+    return value
+
 # ICWS'88 to ICWS'94 Conversion
 # The default modifier for ICWS'88 emulation is determined according to the
 # table below.
@@ -110,42 +159,98 @@ DEFAULT_MODIFIERS = {
         ('JMP','JMZ','JMN','DJN','SPL'): {('#$@<>', '#$@<>'): 'B'}
     }
 
-# Transform the readable form above, into the internal representation
-DEFAULT_MODIFIERS = dict((tuple(OPCODES[opcode] for opcode in opcodes),
-                         dict(((tuple(MODES[a] for a in ab_modes[0]),
-                                tuple(MODES[b] for b in ab_modes[1])),
-                               MODIFIERS[modifier]) for ab_modes, modifier in ab_modes_modifiers.items()))
-                         for opcodes, ab_modes_modifiers in DEFAULT_MODIFIERS.items())
+def _flatten_default_modifiers(table):
+    """Transform the readable form above into a tuple indexed by
+       opcode << 6 | a_mode << 3 | b_mode (modes fit in 3 bits), so finding
+       a default modifier is a single index. None marks invalid combinations.
+    """
+    flat = [None] * ((max(OPCODES.values()) + 1) << 6)
+    for opcodes, ab_modes_modifiers in table.items():
+        for (a_modes, b_modes), modifier in ab_modes_modifiers.items():
+            for opcode in opcodes:
+                for a in a_modes:
+                    for b in b_modes:
+                        key = OPCODES[opcode] << 6 | MODES[a] << 3 | MODES[b]
+                        if flat[key] is None:
+                            flat[key] = MODIFIERS[modifier]
+    return tuple(flat)
+
+DEFAULT_MODIFIER_TABLE = _flatten_default_modifiers(DEFAULT_MODIFIERS)
 
 class Point2D:
-    def __init__(self, x, y=0):
-        if isinstance(x, str):
-            if ':' in x:
-                if y:
-                    raise ValueError("Cannot provide both a string and a y value")
-                x, y = map(int, x.split(':'))
-            else:
-                x = int(x)
-                y = int(y)
+    """A coordinate in the 2D core. Also used for instruction field values.
+
+       Points must not be modified after construction: the hash is computed
+       once, and instances are shared as dict keys and between instructions.
+    """
 
+    __slots__ = ('x', 'y', '_hash', '_str')
+
+    def __init__(self, x, y=0):
+        if type(x) is int and type(y) is int:
             self.x = x
             self.y = y
         elif isinstance(x, Point2D):
-            self.x = x.x
-            self.y = x.y
+            x, y = x.x, x.y
+            self.x = x
+            self.y = y
         else:
-            self.x = int(x)
-            self.y = int(y)
+            x, y = int(x), int(y)
+            self.x = x
+            self.y = y
+        # Points on the x axis hash like the int they compare equal to
+        self._hash = hash((x, y)) if y else hash(x)
+
+    @classmethod
+    def parse(cls, text):
+        """Parse a point from its string form, either 'x' or 'x:y'.
+           Raises ValueError for anything else.
+        """
+        x, separator, y = text.partition(':')
+        return cls.get(int(x), int(y) if separator else 0)
+
+    def __copy__(self):
+        # Points are immutable, so copies can share the instance
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (Point2D, (self.x, self.y))
 
     def __str__(self):
+        # Formatted on first use only, most points are never printed
+        try:
+            return self._str
+        except AttributeError:
+            pass
         if self.y == 0:
-            return str(self.x)
-        return f"{self.x}:{self.y}"
+            text = str(self.x)
+        else:
+            text = f"{self.x}:{self.y}"
+        self._str = text
+        return text
 
     def __eq__(self, other):
+        if self is other:
+            return True
+        # Exact type checks first: dict lookups land here after __hash__
+        kind = type(other)
+        if kind is Point2D:
+            return self.x == other.x and self.y == other.y
+        if kind is int:
+            return self.y == 0 and self.x == other
         if isinstance(other, Point2D):
             return self.x == other.x and self.y == other.y
-        return self.x == other and self.y == 0
+        return self.y == 0 and self.x == other
+
+    def __ne__(self, other):
+        # Spelled out for the Point2D case used by SNE, instead of the
+        # default inversion of __eq__
+        if type(other) is Point2D:
+            return self.x != other.x or self.y != other.y
+        return not self == other
 
     def __gt__(self, other):
         if isinstance(other, Point2D):
@@ -157,44 +262,94 @@ class Point2D:
             return self.x < other.x
         return self.x < other
 
+    @classmethod
+    def get(cls, x, y=0):
+        """Return the point for two ints, sharing one instance per coordinate
+           within POINT_CACHE_RANGE of the origin. Points are never modified
+           once built, so the shared instances are safe to hand out.
+        """
+        if -POINT_CACHE_RANGE <= x <= POINT_CACHE_RANGE and \
+           -POINT_CACHE_RANGE <= y <= POINT_CACHE_RANGE:
+            point = _POINT_CACHE.get((x, y))
+            if point is None:
+                point = _POINT_CACHE[(x, y)] = cls._make(x, y)
+            return point
+        # Points outside the range are not shared, skip the cache lookup
+        return cls._make(x, y)
+
+    @classmethod
+    def _make(cls, x, y):
+        """Construct a point from two ints, bypassing the coercion in
+           __init__. Used by the arithmetic operators.
+        """
+        point = object.__new__(cls)
+        point.x = x
+        point.y = y
+        point._hash = hash((x, y)) if y else hash(x)
+        return point
+
+    # The arithmetic operators build their results with _make when both
+    # operands are known to be ints; other scalars (e.g. floats coming from
+    # '/' in Redcode expressions) still go through the coercing constructor.
+
     def __add__(self, other):
+        if type(other) is int:
+            return Point2D._make(self.x + other, self.y)
         if isinstance(other, Point2D):
-            return Point2D(self.x + other.x, self.y + other.y)
+            return Point2D._make(self.x + other.x, self.y + other.y)
         return Point2D(self.x + other, self.y)
 
     def __radd__(self, other):
+        if type(other) is int:
+            return Point2D._make(other + self.x, self.y)
         return Point2D(other + self.x, self.y)
 
     def __sub__(self, other):
+        if type(other) is int:
+            return Point2D._make(self.x - other, self.y)
         if isinstance(other, Point2D):
-            return Point2D(self.x - other.x, self.y - other.y)
+            return Point2D._make(self.x - other.x, self.y - other.y)
         return Point2D(self.x - other, self.y)
 
     def __rsub__(self, other):
+        if type(other) is int:
+            return Point2D._make(other - self.x, -self.y)
         return Point2D(other - self.x, -self.y)
 
     def __mul__(self, other):
+        if type(other) is int:
+            return Point2D._make(self.x * other, self.y)
         if isinstance(other, Point2D):
-            return Point2D(self.x * other.x, self.y * other.y)
+            return Point2D._make(self.x * other.x, self.y * other.y)
         return Point2D(self.x * other, self.y)
 
     def __rmul__(self, other):
+        if type(other) is int:
+            return Point2D._make(other * self.x, self.y)
         return Point2D(other * self.x, self.y)
 
     def __truediv__(self, other):
+        if type(other) is int:
+            return Point2D._make(self.x // other, self.y)
         if isinstance(other, Point2D):
-            return Point2D(self.x // other.x, self.y)
+            return Point2D._make(self.x // other.x, self.y)
         return Point2D(self.x // other, self.y)
 
     def __rtruediv__(self, other):
+        if type(other) is int:
+            return Point2D._make(other // self.x, 0)
         return Point2D(other // self.x, 0)
 
     def __mod__(self, other):
+        if type(other) is int:
+            return Point2D._make(self.x % other, self.y)
         if isinstance(other, Point2D):
-            return Point2D(self.x % other.x, self.y)
+            return Point2D._make(self.x % other.x, self.y)
         return Point2D(self.x % other, self.y)
 
     def __rmod__(self, other):
+        if type(other) is int:
+            return Point2D._make(other % self.x, 0)
         return Point2D(other % self.x, 0)
 
     def __int__(self):
@@ -204,14 +359,101 @@ class Point2D:
         return int(self.x)
 
     def __hash__(self):
-        return hash((self.x, self.y))
+        return self._hash
 
     def __repr__(self):
         return f"{self.x}:{self.y}"
     
+# Coordinates within this distance of the origin are interned by Point2D.get
+POINT_CACHE_RANGE = 64
+_POINT_CACHE = {}
+
+class InstructionMap(dict):
+    """Map of Point2D -> Instruction that caches its bounds. Setting an item
+       extends cached bounds in place, other modifications drop them."""
+
+    __slots__ = ('_bounds',)
+
+    def __init__(self, *args, **kwargs):
+        super(InstructionMap, self).__init__(*args, **kwargs)
+        self._bounds = None
+
+    def __setitem__(self, key, value):
+        bounds = self._bounds
+        if bounds is not None:
+            if type(key) is Point2D and self:
+                low, high = bounds
+                x, y = key.x, key.y
+                if x < low.x or y < low.y:
+                    low = Point2D(min(x, low.x), min(y, low.y))
+                if x > high.x or y > high.y:
+                    high = Point2D(max(x, high.x), max(y, high.y))
+                self._bounds = low, high
+            else:
+                # Int keys, or the placeholder bounds of an empty map
+                self._bounds = None
+        super(InstructionMap, self).__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._bounds = None
+        super(InstructionMap, self).__delitem__(key)
+
+    def clear(self):
+        self._bounds = None
+        super(InstructionMap, self).clear()
+
+    def pop(self, *args):
+        self._bounds = None
+        return super(InstructionMap, self).pop(*args)
+
+    def popitem(self):
+        self._bounds = None
+        return super(InstructionMap, self).popitem()
+
+    def setdefault(self, key, default=None):
+        self._bounds = None
+        return super(InstructionMap, self).setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        self._bounds = None
+        super(InstructionMap, self).update(*args, **kwargs)
+
+    def __ior__(self, other):
+        self._bounds = None
+        return super(InstructionMap, self).__ior__(other)
+
+    def bounds(self):
+        "Return the (min, max) corners of the used positions, in one pass"
+        if self._bounds is None:
+            if not self:
+                self._bounds = Point2D(0, 0), Point2D(0, 0)
+            else:
+                positions = iter(self)
+                first = next(positions)
+                min_x = max_x = first.x
+                min_y = max_y = first.y
+                for p in positions:
+                    x, y = p.x, p.y
+                    if x < min_x:
+                        min_x = x
+                    elif x > max_x:
+                        max_x = x
+                    if y < min_y:
+                        min_y = y
+                    elif y > max_y:
+                        max_y = y
+                self._bounds = Point2D(min_x, min_y), Point2D(max_x, max_y)
+        return self._bounds
+
 class Warrior(object):
     "An encapsulation of a Redcode Warrior, with instructions and meta-data"
 
+    # labels and environment are set by the parser, the battle statistics and
+    # color by the MARS front ends
+    __slots__ = ('name', 'author', 'date', 'version', 'strategy', 'start',
+                 '_instructions', '_task_queue', 'labels', 'environment',
+                 'wins', 'ties', 'losses', 'color')
+
     def __init__(self, name='Unnamed', author='Anonymous', date=None,
                  version=None, strategy=None, start=Point2D(0)):
         self.name = name
@@ -223,6 +465,25 @@ class Warrior(object):
         self.instructions = {}  # Map of Point2D -> Instruction
         self.task_queue = []
 
+    @property
+    def instructions(self):
+        return self._instructions
+
+    @instructions.setter
+    def instructions(self, instructions):
+        self._instructions = InstructionMap(instructions)
+
+    @property
+    def task_queue(self):
+        """The process counters of the warrior's tasks, next to run first.
+           A deque, as the MARS pops the front on every step.
+        """
+        return self._task_queue
+
+    @task_queue.setter
+    def task_queue(self, task_queue):
+        self._task_queue = deque(task_queue)
+
     def __iter__(self):
         return iter(self.instructions.items())
 
@@ -234,149 +495,150 @@ class Warrior(object):
 
     def get_bounds(self):
         """Get the bounds of the warrior's instructions in 2D space."""
-        if not self.instructions:
-            return Point2D(0, 0), Point2D(0, 0)
-        
-        min_x = min(p.x for p in self.instructions.keys())
-        max_x = max(p.x for p in self.instructions.keys())
-        min_y = min(p.y for p in self.instructions.keys())
-        max_y = max(p.y for p in self.instructions.keys())
-        
-        return Point2D(min_x, min_y), Point2D(max_x, max_y)
+        return self._instructions.bounds()
 
     def get_size(self):
         """Get the size of the warrior in 2D space."""
         min_point, max_point = self.get_bounds()
         return Point2D(max_point.x - min_point.x + 1, max_point.y - min_point.y + 1)
 
+@lru_cache(maxsize=4096, typed=True)
+def _format_instruction(opcode, modifier, stepping, a_mode, a_number, b_mode,
+                        b_number, energy):
+    """Format an instruction from its field values. Cached, as a core is
+       mostly made of a few distinct instructions, so displays and logs
+       format the same ones over and over."""
+    # inverse lookup the instruction values
+    return _INSTRUCTION_FORMAT % (_OPCODES_INV.get(opcode, 'UNKNOWN'),
+                                  _MODIFIERS_INV.get(modifier, modifier),
+                                  _STEP_SUFFIXES.get(stepping, '  '),
+                                  _MODE_CHARS[a_mode],
+                                  a_number,
+                                  _MODE_CHARS[b_mode],
+                                  b_number,
+                                  "; E:%s" % energy if energy else "")
+
+def _field_value(value):
+    """Return the stored form of an A/B-field value: a Point2D, or the
+       expression string of a symbolic value not resolved yet.
+    """
+    if isinstance(value, Point2D):
+        return value
+    if not value:
+        return Point2D.get(0)
+    if isinstance(value, str):
+        try:
+            return Point2D.parse(value)
+        except ValueError:
+            return value
+    return Point2D(value)
+
 class Instruction(object):
     "An encapsulation of a Redcode instruction."
 
+    __slots__ = ('opcode', 'modifier', 'stepping', 'a_mode', 'a_number',
+                 'b_mode', 'b_number', 'energy', 'core', 'fg_color', 'bg_color')
+
     def __init__(self, opcode, modifier=None, stepping=None, a_mode=None, a_number=0,
                  b_mode=None, b_number=0, energy=0):
-        self.opcode = OPCODES[opcode.upper()] if isinstance(opcode, str) else opcode
-        self.modifier = MODIFIERS[modifier.upper()] if isinstance(modifier, str) else modifier
-        # Only convert stepping to uppercase if it's a string and not a mode character
-        if isinstance(stepping, str) and stepping not in MODES:
-            self.stepping = STEP_MODIFIERS[stepping.upper()]
-        else:
-            self.stepping = STEP_NORMAL if stepping is None else stepping
-        if a_mode is not None:
-            self.a_mode = MODES[a_mode] if isinstance(a_mode, str) else a_mode
-        else:
-            self.a_mode = DIRECT
+        self.opcode = lookup_name(OPCODE_VALUES, opcode, 'opcode')
+        self.stepping = STEP_NORMAL if stepping is None else lookup_name(STEP_VALUES, stepping, 'stepping')
+        self.a_mode = DIRECT if a_mode is None else lookup_name(MODE_VALUES, a_mode, 'A-mode')
         if b_mode is not None:
-            self.b_mode = MODES[b_mode] if isinstance(b_mode, str) else b_mode
+            self.b_mode = lookup_name(MODE_VALUES, b_mode, 'B-mode')
         else:
             self.b_mode = IMMEDIATE if self.opcode == DAT and a_number != None else DIRECT
 
-        # Store symbolic values as strings
-        self._a_number = a_number
-        self._b_number = b_number
+        # Symbolic values stay strings until the parser resolves them. After
+        # that both fields are always Point2D and are read and written as
+        # plain attributes.
+        self.a_number = _field_value(a_number)
+        self.b_number = _field_value(b_number)
 
         self.energy = energy
 
-        # Set default modifier if none provided
-        if self.modifier is None:
-            self.modifier = self.default_modifier()
+        if modifier is not None:
+            self.modifier = lookup_name(MODIFIER_VALUES, modifier, 'modifier')
+        else:
+            # Default modifier, indexed inline: the opcode and modes resolved
+            # above are always within the table
+            self.modifier = DEFAULT_MODIFIER_TABLE[self.opcode << 6 | self.a_mode << 3 | self.b_mode]
+            if self.modifier is None:
+                self.default_modifier()  # raises the error for this combination
 
         self.core = None
         self.fg_color = None
         self.bg_color = None
 
+    def __copy__(self):
+        """Copy the fields directly, without going through __init__ or the
+           generic copy protocol. Used by copy() in the MARS step loop.
+        """
+        instruction = Instruction.__new__(Instruction)
+        instruction.opcode = self.opcode
+        instruction.modifier = self.modifier
+        instruction.stepping = self.stepping
+        instruction.a_mode = self.a_mode
+        instruction.a_number = self.a_number
+        instruction.b_mode = self.b_mode
+        instruction.b_number = self.b_number
+        instruction.energy = self.energy
+        instruction.fg_color = self.fg_color
+        instruction.bg_color = self.bg_color
+        instruction.core = self.core
+        return instruction
+
     def core_binded(self, core):
         """Return a copy of this instruction binded to a Core.
         """
-        instruction = copy(self)
+        instruction = self.__copy__()
         instruction.core = core
         return instruction
 
     def normalize(self, size: int):
-        if isinstance(self.a_number, Point2D):
-            self.a_number.x %= size
-            self.a_number.y %= size
-        if isinstance(self.b_number, Point2D):
-            self.b_number.x %= size
-            self.b_number.y %= size
+        """Wrap both fields to the core size. The coordinates are reduced as
+           plain ints and only wrapped into a new Point2D when stored back, so
+           points shared with other instructions are never modified. Fields
+           already within the core are left as they are.
+        """
+        a_number = self.a_number
+        if isinstance(a_number, Point2D):
+            x, y = a_number.x, a_number.y
+            if not (0 <= x < size and 0 <= y < size):
+                self.a_number = Point2D.get(x % size, y % size)
+        b_number = self.b_number
+        if isinstance(b_number, Point2D):
+            x, y = b_number.x, b_number.y
+            if not (0 <= x < size and 0 <= y < size):
+                self.b_number = Point2D.get(x % size, y % size)
 
     def default_modifier(self):
-        for opcodes, modes_modifiers in DEFAULT_MODIFIERS.items():
-            if self.opcode in opcodes:
-                for ab_modes, modifier in modes_modifiers.items():
-                    a_modes, b_modes = ab_modes
-                    if self.a_mode in a_modes and self.b_mode in b_modes:
-                        return modifier
-        raise RuntimeError("Error getting default modifier for instruction: %s" % self)
-
-    @property
-    def a_number(self):
-        if isinstance(self._a_number, str):
-            return self._a_number
-        if isinstance(self._a_number, Point2D):
-            return self._a_number
-        if isinstance(self._a_number, str) and ':' in self._a_number:
-            x, y = map(int, self._a_number.split(':'))
-            return Point2D(x, y)
-        return Point2D(int(self._a_number) if self._a_number else 0)
-
-    @a_number.setter
-    def a_number(self, value):
-        if isinstance(value, Point2D):
-            self._a_number = value
-        elif isinstance(value, str) and ':' in value:
-            x, y = map(int, value.split(':'))
-            self._a_number = Point2D(x, y)
-        else:
-            self._a_number = Point2D(int(value) if value else 0)
-
-    @property
-    def b_number(self):
-        if isinstance(self._b_number, str):
-            return self._b_number
-        if isinstance(self._b_number, Point2D):
-            return self._b_number
-        if isinstance(self._b_number, str) and ':' in self._b_number:
-            x, y = map(int, self._b_number.split(':'))
-            return Point2D(x, y)
-        return Point2D(int(self._b_number) if self._b_number else 0)
-
-    @b_number.setter
-    def b_number(self, value):
-        if isinstance(value, Point2D):
-            self._b_number = value
-        elif isinstance(value, str) and ':' in value:
-            x, y = map(int, value.split(':'))
-            self._b_number = Point2D(x, y)
-        else:
-            self._b_number = Point2D(int(value) if value else 0)
+        try:
+            modifier = DEFAULT_MODIFIER_TABLE[self.opcode << 6 | self.a_mode << 3 | self.b_mode]
+        except (IndexError, TypeError):
+            modifier = None
+        if modifier is None:
+            raise RuntimeError("Error getting default modifier for instruction: %s" % self)
+        return modifier
 
     def __eq__(self, other):
-        return (self.opcode == other.opcode and self.modifier == other.modifier and
-                self.a_mode == other.a_mode and self.a_number == other.a_number and
-                self.b_mode == other.b_mode and self.b_number == other.b_number and
-                self.stepping == other.stepping)
+        if self is other:
+            return True
+        if not isinstance(other, Instruction):
+            return NotImplemented
+        # One tuple comparison instead of a chain of attribute comparisons
+        return ((self.opcode, self.modifier, self.stepping, self.a_mode,
+                 self.b_mode, self.a_number, self.b_number) ==
+                (other.opcode, other.modifier, other.stepping, other.a_mode,
+                 other.b_mode, other.a_number, other.b_number))
 
     def __ne__(self, other):
         return not self == other
 
     def __str__(self):
-        # inverse lookup the instruction values
-        opcode_str = {v: k for k, v in OPCODES.items() if k.isupper() and isinstance(v, int)}.get(self.opcode, 'UNKNOWN')
-        modifier_str = {v: k for k, v in MODIFIERS.items()}.get(self.modifier, str(self.modifier))
-        stepping_str = {v: k for k, v in STEP_MODIFIERS.items()}.get(self.stepping, '')
-        a_mode_str = next(key for key,value in MODES.items() if value==self.a_mode)
-        b_mode_str = next(key for key,value in MODES.items() if value==self.b_mode)
-        energy_str = f"; E:{self.energy}" if self.energy else ""
-        # Only show stepping modifier if it's not the default (D)
-        stepping_suffix = f".{stepping_str}" if stepping_str and stepping_str != 'D' else "  "
-        return "%s.%s%s %s %s, %s %s%s" % (opcode_str,
-                                       modifier_str.ljust(2),
-                                       stepping_suffix,
-                                       a_mode_str,
-                                       str(self.a_number),
-                                       b_mode_str,
-                                       str(self.b_number),
-                                       energy_str)
+        return _format_instruction(self.opcode, self.modifier, self.stepping,
+                                   self.a_mode, self.a_number, self.b_mode,
+                                   self.b_number, self.energy)
 
     def __repr__(self):
         return "<Instruction %s>" % self
@@ -387,7 +649,6 @@ class Instruction(object):
 
     def consume_energy(self, amount=1):
         """Consume energy from the instruction."""
-        print(f"Consuming energy from {self} with amount {amount}")
         if self.energy >= amount:
             self.energy -= amount
             return True
@@ -399,8 +660,18 @@ class Instruction(object):
         self.energy = total_energy // 2
         other_instruction.energy = total_energy - self.energy
 
-def parse(input, definitions={}):
+def parse(input, definitions=None):
     """Parse Redcode from a line iterator returning a Warrior object."""
-    from parser import parse as parse_warrior
-    return parse_warrior(input, definitions)
+    global _parse_warrior
+    if _parse_warrior is None:
+        from parser import parse as _parse_warrior
+    return _parse_warrior(input, definitions)
+
+# The parser builds on the classes above, so it can only be imported once they
+# are defined. When the parser is the module being imported first, this import
+# fails on the partially initialized module and parse() imports it on first use.
+try:
+    from parser import parse as _parse_warrior
+except ImportError:
+    _parse_warrior = None
 
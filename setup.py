@@ -0,0 +1,71 @@
+#! /usr/bin/env python3
+# coding: utf-8
+
+"""Optional ahead-of-time compilation of the hot modules with Cython.
+
+The simulator runs as plain Python. When Cython and a C toolchain are
+available, the modules below can be compiled in place, and the resulting
+extension modules shadow the ``.py`` files on import:
+
+    python setup.py build_ext --inplace
+
+Set ``COREWAR_CYTHON=0`` to skip compilation. If Cython is not installed
+or compilation fails, nothing is built and the pure Python modules are
+used unchanged.
+
+This script only builds the extensions. It declares no packages, as the
+modules import each other as top-level modules from the corewar directory
+rather than as a package.
+"""
+
+import os
+import sys
+
+from setuptools import setup
+from setuptools.command.build_ext import build_ext
+from setuptools.errors import BaseError as DistutilsError, CCompilerError
+
+CYTHON_MODULES = ['corewar/redcode.py', 'corewar/parser.py']
+
+# The annotations describe the Python API and are not C types: with
+# annotation typing on, Cython turns e.g. `stepping: str` into a hard
+# argument check that rejects None
+COMPILER_DIRECTIVES = {'annotation_typing': False}
+
+
+def cython_extensions():
+    """Return the extension modules to build, or an empty list if Cython
+       is disabled or unavailable.
+    """
+    if os.environ.get('COREWAR_CYTHON', '1') == '0':
+        return []
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        return []
+    return cythonize(CYTHON_MODULES, language_level=3,
+                     compiler_directives=COMPILER_DIRECTIVES)
+
+
+class optional_build_ext(build_ext):
+    """Build extensions, falling back to pure Python when compilation fails."""
+
+    def run(self):
+        try:
+            build_ext.run(self)
+        except DistutilsError as e:
+            print("Cython build failed, using pure Python modules: %s" % e,
+                  file=sys.stderr)
+
+    def build_extension(self, ext):
+        try:
+            build_ext.build_extension(self, ext)
+        except (CCompilerError, DistutilsError) as e:
+            print("Cython build of %s failed, using pure Python module: %s"
+                  % (ext.name, e), file=sys.stderr)
+
+
+setup(name='corewar2d',
+      description='MARS (Memory Array Redcode Simulator) in two dimensions',
+      ext_modules=cython_extensions(),
+      cmdclass={'build_ext': optional_build_ext})
@@ -17,6 +17,9 @@ from redcode import Point2D
 
 DEFAULT_ENV = {'CORESIZE': 8000, 'MAXLENGTH': 100}
 
+# Marks the end of a core dump in the step logs, with the next task address
+ACTIVE_RE = re.compile(r';ACTIVE: ([0-9]{5})')
+
 class TestMars(unittest.TestCase):
 
     def test_dwarf_versus_sitting_duck(self):
@@ -89,7 +92,7 @@ class TestMars(unittest.TestCase):
         with open(os.path.join(current_path, log_filename)) as f:
             accum_lines = []
             for n, line in enumerate(f):
-                m = re.match(r';ACTIVE: ([0-9]{5})', line)
+                m = ACTIVE_RE.match(line)
                 if line.startswith(';ACTIVE:') and not m:
                     self.fail("Fatal error in regular expression line %d" % n)
 
@@ -115,19 +118,22 @@ class TestMars(unittest.TestCase):
                                   (next_queued, simulation.point_to_index(actual_pos), nth, n))
 
                     # Compare instructions in memory with expected instructions
-                    for pos, expected_instr in expected.instructions.items():
-                        expected_instr.normalize(simulation.core.size)
-                    
-                        # Get the actual instruction at this position
-                        actual_instr = simulation.core[pos+core_start]
-                        actual_instr.normalize(simulation.core.size)
-                        
-                        if expected_instr != actual_instr:
-                            print()
-                            print(f"Position {pos}:")
-                            print(f"Expected: {expected_instr}")
-                            print(f"Actual:   {actual_instr}")
-                            self.fail("Core don't match, step %d, line %d" % (nth, n))
+                    positions = list(expected.instructions)
+                    expected_instrs = list(expected.instructions.values())
+                    actual_instrs = [simulation.core[pos+core_start] for pos in positions]
+                    for instr in expected_instrs + actual_instrs:
+                        instr.normalize(simulation.core.size)
+
+                    # Compare everything at once, only look for the
+                    # mismatching position to report it
+                    if expected_instrs != actual_instrs:
+                        for pos, expected_instr, actual_instr in zip(positions, expected_instrs, actual_instrs):
+                            if expected_instr != actual_instr:
+                                print()
+                                print(f"Position {pos}:")
+                                print(f"Expected: {expected_instr}")
+                                print(f"Actual:   {actual_instr}")
+                                self.fail("Core don't match, step %d, line %d" % (nth, n))
 
                     # next state
                     simulation.step()
@@ -1,4 +1,6 @@
+import pickle
 import unittest
+from copy import copy, deepcopy
 from redcode import Point2D, Instruction, MOV, M_F, DIRECT
 
 class TestPoint2D(unittest.TestCase):
@@ -16,6 +18,32 @@ class TestPoint2D(unittest.TestCase):
         self.assertEqual(p.y, 2)
         self.assertEqual(str(p), "1:2")
 
+    def test_parse(self):
+        self.assertEqual(Point2D(42), Point2D.parse("42"))
+        self.assertEqual(Point2D(1, -2), Point2D.parse("1:-2"))
+        with self.assertRaises(ValueError):
+            Point2D.parse("start")
+        with self.assertRaises(ValueError):
+            Point2D.parse("1:2:3")
+
+    def test_get(self):
+        self.assertIs(Point2D.get(1, 2), Point2D.get(1, 2))
+        self.assertEqual(Point2D(1, 2), Point2D.get(1, 2))
+        self.assertEqual(Point2D(100000), Point2D.get(100000))
+
+    def test_hash(self):
+        self.assertEqual(hash(Point2D(1, 2)), hash(Point2D.parse("1:2")))
+        # Points on the x axis are interchangeable with ints as dict keys
+        self.assertEqual('a', {5: 'a'}[Point2D(5)])
+        self.assertEqual('b', {Point2D(7, 0): 'b'}[7])
+
+    def test_copy(self):
+        p = Point2D(1, 2)
+        self.assertIs(p, copy(p))
+        self.assertIs(p, deepcopy(p))
+        self.assertEqual(p, pickle.loads(pickle.dumps(p)))
+        self.assertEqual(hash(p), hash(pickle.loads(pickle.dumps(p))))
+
     def test_instruction_parsing(self):
         # Test that instructions handle both numbers and 2D points
         instr1 = Instruction(MOV, M_F, None, DIRECT, "42", DIRECT, "0")
@@ -1,9 +1,10 @@
 #! /usr/bin/env python3
 #! coding: utf-8
 
+import io
 import unittest
 from redcode import *
-from redcode import Point2D
+from redcode import Point2D, STEP_VERTICAL
 
 DEFAULT_ENV = {'CORESIZE': 8000}
 
@@ -37,6 +38,78 @@ class TestRedcodeAssembler(unittest.TestCase):
         self.assertEqual(Instruction(JMP, M_F, None, DIRECT, -2, DIRECT, 0),
                           warrior.instructions[Point2D(2, 0)])
 
+    def test_mixed_case_names(self):
+
+        warrior = parse(['Mov.Ab.s #1, 2', 'mOv.aB.S #1, 2'], DEFAULT_ENV)
+
+        self.assertEqual(warrior.instructions[Point2D(0, 0)],
+                         warrior.instructions[Point2D(0, 1)])
+        self.assertEqual(Instruction(MOV, M_AB, STEP_VERTICAL, IMMEDIATE, 1, DIRECT, 2),
+                         warrior.instructions[Point2D(0, 0)])
+
+    def test_metadata_comments(self):
+
+        input = """
+                mov 0, 1
+                ;redcode-94
+                ;REDCODE
+                ;name Imp
+                ;Author A. K. Dewdney
+                ;date 1984
+                ;version 2
+                ;strat moves forward
+                ;strategy and keeps moving
+                ;assert CORESIZE == 8000
+                ;namex not a directive
+                mov 0, 1
+                """
+        warrior = parse(input.split('\n'), DEFAULT_ENV)
+
+        self.assertEqual('Imp', warrior.name)
+        self.assertEqual('A. K. Dewdney', warrior.author)
+        self.assertEqual('1984', warrior.date)
+        self.assertEqual('2', warrior.version)
+        self.assertEqual('moves forward\nand keeps moving', warrior.strategy)
+        self.assertEqual(1, len(warrior))
+
+        with self.assertRaises(AssertionError):
+            parse([';assert CORESIZE == 800'], DEFAULT_ENV)
+
+    def test_input_forms(self):
+
+        source = "start mov 0, 1\n      jmp start\n"
+
+        from_lines = parse(source.split('\n'), DEFAULT_ENV)
+        from_file = parse(io.StringIO(source), DEFAULT_ENV)
+        from_string = parse(source, DEFAULT_ENV)
+
+        for warrior in (from_file, from_string):
+            self.assertEqual(from_lines.instructions, warrior.instructions)
+            self.assertEqual(from_lines.labels, warrior.labels)
+
+    def test_invalid_fields(self):
+        with self.assertRaisesRegex(ValueError, 'opcode: 99'):
+            Instruction(99)
+        with self.assertRaisesRegex(ValueError, "opcode: 'MOOV'"):
+            Instruction('MOOV')
+        with self.assertRaisesRegex(ValueError, "modifier: 'Y'"):
+            Instruction('MOV', 'Y')
+        with self.assertRaisesRegex(ValueError, "A-mode: '%'"):
+            Instruction('MOV', 'I', None, '%')
+
+    def test_identical_lines(self):
+        warrior = parse(['dat 0, 0', 'dat 0, 0'], DEFAULT_ENV)
+        first, second = warrior.instructions.values()
+        self.assertEqual(first, second)
+        first.energy = 5
+        self.assertNotEqual(5, second.energy)
+
+    def test_task_queue(self):
+        warrior = Warrior()
+        warrior.task_queue = [Point2D(1), Point2D(2, 3)]
+        self.assertEqual(Point2D(1), warrior.task_queue.popleft())
+        self.assertEqual([Point2D(2, 3)], list(warrior.task_queue))
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -1,9 +1,14 @@
 import pytest
 from core import Core, Point2D
+from redcode import Instruction
 
-def test_point_to_index_basic():
+@pytest.fixture(scope="module")
+def core():
+    """A 10x10 core, shared by the read-only addressing tests"""
+    return Core(size=100, width=10)
+
+def test_point_to_index_basic(core):
     """Test basic 2D to 1D conversion"""
-    core = Core(size=100, width=10)  # 10x10 grid
     assert core.point_to_index(Point2D(0, 0)) == 0
     assert core.point_to_index(Point2D(1, 0)) == 1
     assert core.point_to_index(Point2D(2, 0)) == 2
@@ -12,9 +17,8 @@ def test_point_to_index_basic():
     assert core.point_to_index(Point2D(3, 4)) == 43
     assert core.point_to_index(Point2D(9, 9)) == 99
 
-def test_point_to_index_wrapping():
+def test_point_to_index_wrapping(core):
     """Test wrapping behavior within rows and columns"""
-    core = Core(size=100, width=10)
     
     # Test x wrapping within row
     assert core.point_to_index(Point2D(10, 0)) == 10  # wraps to start of row
@@ -27,9 +31,8 @@ def test_point_to_index_wrapping():
     assert core.point_to_index(Point2D(0, 11)) == 11 # wraps to second pos of second column
     assert core.point_to_index(Point2D(0, -1)) == 99  # wraps to start of last column
 
-def test_point_to_index_overflow():
+def test_point_to_index_overflow(core):
     """Test handling of overflow between rows"""
-    core = Core(size=100, width=10)
     
     # Test x overflow to next row
     assert core.point_to_index(Point2D(10, 0)) == 10  # wraps to start of next row
@@ -39,9 +42,8 @@ def test_point_to_index_overflow():
     assert core.point_to_index(Point2D(-1, 0)) == 99  # wraps to end of previous row
     assert core.point_to_index(Point2D(-11, 0)) == 89  # wraps to end of previous row
 
-def test_point_to_index_negative():
+def test_point_to_index_negative(core):
     """Test handling of negative coordinates"""
-    core = Core(size=100, width=10)
     
     # Test negative x values
     assert core.point_to_index(Point2D(-1, 0)) == 99
@@ -58,9 +60,8 @@ def test_point_to_index_negative():
     assert core.point_to_index(Point2D(-11, -11)) == 77
 
 
-def test_point_to_index_edge_cases():
+def test_point_to_index_edge_cases(core):
     """Test edge cases and boundary conditions"""
-    core = Core(size=100, width=10)
     
     # Test at grid boundaries
     assert core.point_to_index(Point2D(9, 0)) == 9  # end of first row
@@ -92,3 +93,13 @@ def test_point_to_grid():
     # Test trim with negative values
     assert core.point_to_grid(Point2D(-1, 0)) == Point2D(2, 1)  # Wraps to previous row
     assert core.point_to_grid(Point2D(0, -1)) == Point2D(2, 1)  # Wraps to previous column
+
+def test_clear_binds_instruction_copies():
+    core = Core(size=6, width=3)
+    instruction = Instruction('MOV', 'I', 'S', '#', 1, '$', 2, energy=5)
+    core.clear(instruction)
+
+    assert all(cell == instruction for cell in core)
+    assert all(cell.core is core and cell is not instruction for cell in core)
+    assert all(cell.energy == 5 for cell in core)
+    assert len(set(map(id, core))) == 6
@@ -9,117 +9,112 @@ from mars import MARS
 from redcode import Warrior
 from redcode import Point2D
 
-def test_long_term_add_effects():
-    """Test long-term effects of repeated ADD operations with different offsets."""
+# Jumps back to the instruction before it. Shared by the test warriors below:
+# the MARS loads copies of warrior instructions, never the objects themselves.
+JMP_BACK = Instruction(opcode=JMP, modifier=M_A, a_mode=DIRECT, b_mode=DIRECT, a_number=-1, b_number=-1)
+
+def find_cycle(mars, warrior, steps):
+    """Step the MARS up to steps times, stopping as soon as the warrior's
+       next task lands on a position it has been on before. Returns whether
+       that happened."""
+    seen = set()
+    for _ in range(steps):
+        mars.step()
+        if warrior.task_queue:
+            position = warrior.task_queue[0]
+            if position in seen:
+                return True
+            seen.add(position)
+    return False
+
+@pytest.mark.parametrize("a_number,b_number", [
     # Test different ADD offsets that will cause interesting wrapping patterns
-    test_cases = [
-        (3, 1),  # Small offset, frequent wrapping
-        (7, 1),  # Large offset, less frequent wrapping
-        (9, 1),  # Almost full width, minimal movement
-        (11, 1), # Larger than width, interesting wrapping
-    ]
-    
-    for a_number, b_number in test_cases:
-        warrior = Warrior(name=f"add_{a_number}_{b_number}", author="test")
-        warrior.instructions = {
-            Point2D(0, 0): Instruction(opcode=ADD, modifier=M_F, a_mode=IMMEDIATE, b_mode=DIRECT, 
-                       a_number=a_number, b_number=b_number),
-            Point2D(1, 0): Instruction(opcode=JMP, modifier=M_A, a_mode=DIRECT, b_mode=DIRECT, a_number=-1, b_number=-1)
-        }
-        
-        core = Core(width=10, size=100)
-        mars = MARS(core=core, warriors=[warrior])
-        
-        # Initialize at (0,0)
-        current_pos = Point2D(0, 0)
-        mars.enqueue(warrior, current_pos)
-        
-        # Run for multiple cycles to observe patterns
-        positions = []
-        for _ in range(100):  # Run for 100 steps
-            mars.step()
-            if warrior.task_queue:
-                positions.append(warrior.task_queue[0])
-        
-        # Verify that we eventually return to a previous position (cycle detection)
-        assert len(positions) > 0, "No positions recorded"
-        assert positions[-1] in positions[:-1], "No cycle detected in ADD pattern"
+    (3, 1),  # Small offset, frequent wrapping
+    (7, 1),  # Large offset, less frequent wrapping
+    (9, 1),  # Almost full width, minimal movement
+    (11, 1), # Larger than width, interesting wrapping
+])
+def test_long_term_add_effects(a_number, b_number):
+    """Test long-term effects of repeated ADD operations with different offsets."""
+    warrior = Warrior(name=f"add_{a_number}_{b_number}", author="test")
+    warrior.instructions = {
+        Point2D(0, 0): Instruction(opcode=ADD, modifier=M_F, a_mode=IMMEDIATE, b_mode=DIRECT, 
+                   a_number=a_number, b_number=b_number),
+        Point2D(1, 0): JMP_BACK
+    }
+    
+    core = Core(width=10, size=100)
+    mars = MARS(core=core, warriors=[warrior])
+    
+    # Initialize at (0,0)
+    current_pos = Point2D(0, 0)
+    mars.enqueue(warrior, current_pos)
+    
+    # Run for up to 100 steps and verify that we eventually return to a
+    # previous position (cycle detection)
+    assert find_cycle(mars, warrior, 100), "No cycle detected in ADD pattern"
 
-def test_multiplicative_effects():
-    """Test effects of multiplication operations on position calculations."""
+@pytest.mark.parametrize("a_number,b_number", [
     # Test different multiplication factors
-    test_cases = [
-        (2, 1),  # Doubling
-        (3, 1),  # Tripling
-        (5, 1),  # Larger prime factor
-        (7, 1),  # Another prime factor
-    ]
-    
-    for a_number, b_number in test_cases:
-        warrior = Warrior(name=f"mul_{a_number}_{b_number}", author="test")
-        warrior.instructions = {
-            Point2D(0, 0): Instruction(opcode=MUL, modifier=M_F, a_mode=IMMEDIATE, b_mode=DIRECT,
-                       a_number=a_number, b_number=b_number),
-            Point2D(1, 0): Instruction(opcode=JMP, modifier=M_A, a_mode=DIRECT, b_mode=DIRECT, a_number=-1, b_number=-1)
-        }
-        
-        core = Core(width=10, size=100)
-        mars = MARS(core=core, warriors=[warrior])
-        
-        # Initialize at (1,0) to avoid multiplication by zero
-        current_pos = Point2D(1, 0)
-        mars.enqueue(warrior, current_pos)
-        
-        # Run for multiple cycles
-        positions = []
-        for _ in range(50):  # Run for 50 steps
-            mars.step()
-            if warrior.task_queue:
-                positions.append(warrior.task_queue[0])
-        
-        print(positions)
-
-        # Verify that multiplication leads to expected growth patterns
-        assert len(positions) > 0, "No positions recorded"
-        # Check that we eventually wrap around
-        assert any(p.x != positions[0].x for p in positions), "No wrapping detected in MUL pattern"
+    (2, 1),  # Doubling
+    (3, 1),  # Tripling
+    (5, 1),  # Larger prime factor
+    (7, 1),  # Another prime factor
+])
+def test_multiplicative_effects(a_number, b_number):
+    """Test effects of multiplication operations on position calculations."""
+    warrior = Warrior(name=f"mul_{a_number}_{b_number}", author="test")
+    warrior.instructions = {
+        Point2D(0, 0): Instruction(opcode=MUL, modifier=M_F, a_mode=IMMEDIATE, b_mode=DIRECT,
+                   a_number=a_number, b_number=b_number),
+        Point2D(1, 0): JMP_BACK
+    }
+    
+    core = Core(width=10, size=100)
+    mars = MARS(core=core, warriors=[warrior])
+    
+    # Initialize at (1,0) to avoid multiplication by zero
+    current_pos = Point2D(1, 0)
+    mars.enqueue(warrior, current_pos)
+    
+    # Run for multiple cycles
+    positions = []
+    for _ in range(50):  # Run for 50 steps
+        mars.step()
+        if warrior.task_queue:
+            positions.append(warrior.task_queue[0])
+    
+    # Verify that multiplication leads to expected growth patterns
+    assert len(positions) > 0, "No positions recorded"
+    # Check that we eventually wrap around
+    assert any(p.x != positions[0].x for p in positions), "No wrapping detected in MUL pattern"
 
-def test_modulo_effects():
-    """Test effects of modulo operations on position calculations."""
+@pytest.mark.parametrize("a_number,b_number", [
     # Test different modulo divisors
-    test_cases = [
-        (3, 1),  # Small divisor
-        (5, 1),  # Medium divisor
-        (7, 1),  # Larger divisor
-        (9, 1),  # Almost full width
-    ]
-    
-    for a_number, b_number in test_cases:
-        warrior = Warrior(name=f"mod_{a_number}_{b_number}", author="test")
-        warrior.instructions = {
-            Point2D(0, 0): Instruction(opcode=MOD, modifier=M_F, a_mode=IMMEDIATE, b_mode=DIRECT,
-                       a_number=a_number, b_number=b_number),
-            Point2D(1, 0): Instruction(opcode=JMP, modifier=M_A, a_mode=DIRECT, b_mode=DIRECT, a_number=-1, b_number=-1)
-        }
-        
-        core = Core(width=10, size=100)
-        mars = MARS(core=core, warriors=[warrior])
-        
-        # Initialize at (1,0)
-        current_pos = Point2D(1, 0)
-        mars.enqueue(warrior, current_pos)
-        
-        # Run for multiple cycles
-        positions = []
-        for _ in range(50):
-            mars.step()
-            if warrior.task_queue:
-                positions.append(warrior.task_queue[0])
-        
-        # Verify that modulo operations create repeating patterns
-        assert len(positions) > 0, "No positions recorded"
-        # Check for cycle in the pattern
-        assert positions[-1] in positions[:-1], "No cycle detected in MOD pattern"
+    (3, 1),  # Small divisor
+    (5, 1),  # Medium divisor
+    (7, 1),  # Larger divisor
+    (9, 1),  # Almost full width
+])
+def test_modulo_effects(a_number, b_number):
+    """Test effects of modulo operations on position calculations."""
+    warrior = Warrior(name=f"mod_{a_number}_{b_number}", author="test")
+    warrior.instructions = {
+        Point2D(0, 0): Instruction(opcode=MOD, modifier=M_F, a_mode=IMMEDIATE, b_mode=DIRECT,
+                   a_number=a_number, b_number=b_number),
+        Point2D(1, 0): JMP_BACK
+    }
+    
+    core = Core(width=10, size=100)
+    mars = MARS(core=core, warriors=[warrior])
+    
+    # Initialize at (1,0)
+    current_pos = Point2D(1, 0)
+    mars.enqueue(warrior, current_pos)
+    
+    # Run for up to 50 steps and verify that modulo operations create
+    # repeating patterns
+    assert find_cycle(mars, warrior, 50), "No cycle detected in MOD pattern"
 
 def test_combined_operations():
     """Test effects of combining different operations."""
@@ -138,52 +133,42 @@ def test_combined_operations():
     current_pos = Point2D(1, 0)
     mars.enqueue(warrior, current_pos)
     
+    # Run for up to 100 steps and verify that combined operations create
+    # complex but repeating patterns
+    assert find_cycle(mars, warrior, 100), "No cycle detected in combined operations pattern"
+
+@pytest.mark.parametrize("a_mode,b_mode", [
+    # Test different addressing mode combinations
+    (IMMEDIATE, DIRECT),        # Basic immediate to direct
+    (DIRECT, INDIRECT_A),       # Direct to indirect A
+    (INDIRECT_A, PREDEC_A),     # Indirect A to pre-decrement A
+    (PREDEC_A, POSTINC_A),      # Pre-decrement A to post-increment A
+])
+def test_addressing_mode_effects(a_mode, b_mode):
+    """Test effects of different addressing modes on position calculations."""
+    warrior = Warrior(name=f"addr_{a_mode}_{b_mode}", author="test")
+    warrior.instructions = {
+        Point2D(0, 0): Instruction(opcode=ADD, modifier=M_F, a_mode=a_mode, b_mode=b_mode,
+                   a_number=3, b_number=1),
+        Point2D(1, 0): JMP_BACK
+    }
+    
+    core = Core(width=10, size=100)
+    mars = MARS(core=core, warriors=[warrior])
+    
+    # Initialize at (1,0)
+    current_pos = Point2D(1, 0)
+    mars.enqueue(warrior, current_pos)
+    
     # Run for multiple cycles
     positions = []
-    for _ in range(100):
+    for _ in range(50):
         mars.step()
         if warrior.task_queue:
             positions.append(warrior.task_queue[0])
     
-    # Verify that combined operations create complex but repeating patterns
+    # Verify that addressing modes affect position calculations
     assert len(positions) > 0, "No positions recorded"
-    # Check for cycle in the pattern
-    assert positions[-1] in positions[:-1], "No cycle detected in combined operations pattern"
-
-def test_addressing_mode_effects():
-    """Test effects of different addressing modes on position calculations."""
-    # Test different addressing mode combinations
-    test_cases = [
-        (IMMEDIATE, DIRECT),        # Basic immediate to direct
-        (DIRECT, INDIRECT_A),       # Direct to indirect A
-        (INDIRECT_A, PREDEC_A),     # Indirect A to pre-decrement A
-        (PREDEC_A, POSTINC_A),      # Pre-decrement A to post-increment A
-    ]
-    
-    for a_mode, b_mode in test_cases:
-        warrior = Warrior(name=f"addr_{a_mode}_{b_mode}", author="test")
-        warrior.instructions = {
-            Point2D(0, 0): Instruction(opcode=ADD, modifier=M_F, a_mode=a_mode, b_mode=b_mode,
-                       a_number=3, b_number=1),
-            Point2D(1, 0): Instruction(opcode=JMP, modifier=M_A, a_mode=DIRECT, b_mode=DIRECT, a_number=-1, b_number=-1)
-        }
-        
-        core = Core(width=10, size=100)
-        mars = MARS(core=core, warriors=[warrior])
-        
-        # Initialize at (1,0)
-        current_pos = Point2D(1, 0)
-        mars.enqueue(warrior, current_pos)
-        
-        # Run for multiple cycles
-        positions = []
-        for _ in range(50):
-            mars.step()
-            if warrior.task_queue:
-                positions.append(warrior.task_queue[0])
-        
-        # Verify that addressing modes affect position calculations
-        assert len(positions) > 0, "No positions recorded"
-        # Check that different addressing modes produce different patterns
-        if a_mode != IMMEDIATE or b_mode != DIRECT:
-            assert positions[1] != Point2D(4, 0), "Addressing modes not affecting position calculation" 
+    # Check that different addressing modes produce different patterns
+    if a_mode != IMMEDIATE or b_mode != DIRECT:
+        assert positions[1] != Point2D(4, 0), "Addressing modes not affecting position calculation" 
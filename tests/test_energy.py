@@ -1,4 +1,5 @@
 import pytest
+from itertools import islice
 from corewar.mars import MARS
 from corewar.redcode import parse, Point2D, JMP
 
@@ -24,10 +25,8 @@ def test_energy_consumption():
     assert initial_instruction.energy == 10, "Initial energy should be 10"
     
     # Run for 10 steps - exactly use up enegery
-    for i in range(10):
-        mars.step()
-    
-        assert len(warrior.task_queue) > 0, "Warrior should still be alive"
+    assert mars.step_many(10) == 10
+    assert len(warrior.task_queue) > 0, "Warrior should still be alive"
     
     # Get final instruction
     final_instruction = mars[initial_pos]
@@ -38,7 +37,7 @@ def test_energy_consumption():
     # Verify warrior is still alive (task queue not empty)
     
     # Run one more step
-    mars.step()
+    assert mars.step_many(1) == 1
     
     # Verify instruction is not executed (energy is 0)
     assert final_instruction.energy == 0, "Energy should remain at 0"
@@ -46,6 +45,9 @@ def test_energy_consumption():
     # Verify warrior is still alive (task queue not empty)
     assert len(warrior.task_queue) == 0, "Warrior should have died"
 
+    # No more steps run once the warrior is dead
+    assert mars.step_many(5) == 0
+
 def test_instruction_energy_syntax():
     # Create a warrior with different energy values per instruction
     warrior_code = """
@@ -65,15 +67,15 @@ def test_instruction_energy_syntax():
     mars.load_warriors()
     
     # Get instructions
-    instructions = list(warrior.instructions.values())
+    instructions = warrior.instructions
     
     # Verify energy values were set correctly
-    assert instructions[0].energy == 100, "First instruction should have 100 energy"
-    assert instructions[1].energy == 50, "Second instruction should have 50 energy"
-    assert instructions[2].energy == 200, "Third instruction should have 200 energy"
+    assert instructions[Point2D(0)].energy == 100, "First instruction should have 100 energy"
+    assert instructions[Point2D(1)].energy == 50, "Second instruction should have 50 energy"
+    assert instructions[Point2D(2)].energy == 200, "Third instruction should have 200 energy"
     
     # Verify other instructions have default energy
-    for instruction in instructions[3:]:
+    for instruction in islice(instructions.values(), 3, None):
         assert instruction.energy == 1000, "Other instructions should have default energy"
 
 def test_complex_instruction_energy():
@@ -95,17 +97,17 @@ def test_complex_instruction_energy():
     mars.load_warriors()
     
     # Get instructions
-    instructions = list(warrior.instructions.values())
+    instructions = warrior.instructions
     
     # Verify energy values were set correctly
-    assert instructions[0].energy == 100, "First instruction should have 100 energy"
-    assert instructions[1].energy == 50, "Second instruction should have 50 energy"
-    assert instructions[2].energy == 200, "Third instruction should have 200 energy"
+    assert instructions[Point2D(0)].energy == 100, "First instruction should have 100 energy"
+    assert instructions[Point2D(1)].energy == 50, "Second instruction should have 50 energy"
+    assert instructions[Point2D(2)].energy == 200, "Third instruction should have 200 energy"
     
     # Verify instruction fields were parsed correctly
-    assert str(instructions[0]) == "MOV.AB   # 1, @ 2; E:100", "First instruction parsing failed"
-    assert str(instructions[1]) == "ADD.B    $ 3, * 4; E:50", "Second instruction parsing failed"
-    assert str(instructions[2]) == "JMP.B    < 5, $ 0; E:200", "Third instruction parsing failed"
+    assert str(instructions[Point2D(0)]) == "MOV.AB   # 1, @ 2; E:100", "First instruction parsing failed"
+    assert str(instructions[Point2D(1)]) == "ADD.B    $ 3, * 4; E:50", "Second instruction parsing failed"
+    assert str(instructions[Point2D(2)]) == "JMP.B    < 5, $ 0; E:200", "Third instruction parsing failed"
 
 def test_energy_with_regular_comments():
     # Test energy values with regular comments
@@ -126,12 +128,12 @@ def test_energy_with_regular_comments():
     mars.load_warriors()
     
     # Get instructions
-    instructions = list(warrior.instructions.values())
+    instructions = warrior.instructions
     
     # Verify energy values were set correctly
-    assert instructions[0].energy == 100, "First instruction should have 100 energy"
-    assert instructions[1].energy == 50, "Second instruction should have 50 energy"
-    assert instructions[2].energy == 200, "Third instruction should have 200 energy"
+    assert instructions[Point2D(0)].energy == 100, "First instruction should have 100 energy"
+    assert instructions[Point2D(1)].energy == 50, "Second instruction should have 50 energy"
+    assert instructions[Point2D(2)].energy == 200, "Third instruction should have 200 energy"
 
 def test_single_argument_energy():
     # Test energy values with single argument instructions
@@ -152,9 +154,9 @@ def test_single_argument_energy():
     mars.load_warriors()
     
     # Get instructions
-    instructions = list(warrior.instructions.values())
+    instructions = warrior.instructions
     
     # Verify energy values were set correctly
-    assert instructions[0].energy == 100, "First instruction should have 100 energy"
-    assert instructions[1].energy == 50, "Second instruction should have 50 energy"
-    assert instructions[2].energy == 200, "Third instruction should have 200 energy" 
\ No newline at end of file
+    assert instructions[Point2D(0)].energy == 100, "First instruction should have 100 energy"
+    assert instructions[Point2D(1)].energy == 50, "Second instruction should have 50 energy"
+    assert instructions[Point2D(2)].energy == 200, "Third instruction should have 200 energy" 
\ No newline at end of file
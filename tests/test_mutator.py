@@ -33,10 +33,7 @@ def test_mutate_core():
     mars = MARS(core=core)
     
     # Fill core with known instructions
-    for x in range(10):
-        for y in range(10):
-            pos = Point2D(x, y)
-            mars.set_instruction(pos, copy(DEFAULT_INITIAL_INSTRUCTION))
+    core.clear(DEFAULT_INITIAL_INSTRUCTION)
     
     # Perform mutations
     num_mutations = 5
@@ -46,13 +43,8 @@ def test_mutate_core():
     assert mutations_performed == num_mutations
     
     # Verify that some instructions were changed
-    changed = 0
-    for x in range(10):
-        for y in range(10):
-            pos = Point2D(x, y)
-            instr = mars.get_instruction(pos)
-            if instr.opcode != 1 or instr.modifier != 6:  # MOV.I
-                changed += 1
+    changed = sum(1 for instr in core
+                  if instr.opcode != 1 or instr.modifier != 6)  # MOV.I
     
     assert changed > 0
 
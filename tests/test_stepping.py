@@ -4,31 +4,35 @@ from mars import MARS
 from core import Core
 
 def test_parse_stepping_modifiers():
+    origin = Point2D(0, 0)
+
     # Test default stepping (no modifier)
     warrior = parse(['MOV.I #0, 0'])
-    assert warrior.instructions[Point2D(0, 0)].stepping == STEP_NORMAL
+    assert warrior.instructions[origin].stepping == STEP_NORMAL
     
     # Test W (vertical backward)
     warrior = parse(['MOV.I.W #0, 0:1'])
-    assert warrior.instructions[Point2D(0, 0)].stepping == STEP_VERTICAL_BACKWARD
-    assert isinstance(warrior.instructions[Point2D(0, 0)].b_number, Point2D)
-    assert warrior.instructions[Point2D(0, 0)].b_number.x == 0
-    assert warrior.instructions[Point2D(0, 0)].b_number.y == 1
+    instruction = warrior.instructions[origin]
+    assert instruction.stepping == STEP_VERTICAL_BACKWARD
+    assert isinstance(instruction.b_number, Point2D)
+    assert instruction.b_number.x == 0
+    assert instruction.b_number.y == 1
     
     # Test Q (backward)
     warrior = parse(['MOV.I.Q #0, 0'])
-    assert warrior.instructions[Point2D(0, 0)].stepping == STEP_BACKWARD
+    assert warrior.instructions[origin].stepping == STEP_BACKWARD
     
     # Test S (vertical)
     warrior = parse(['MOV.I.S #0, 0:1'])
-    assert warrior.instructions[Point2D(0, 0)].stepping == STEP_VERTICAL
-    assert isinstance(warrior.instructions[Point2D(0, 0)].b_number, Point2D)
-    assert warrior.instructions[Point2D(0, 0)].b_number.x == 0
-    assert warrior.instructions[Point2D(0, 0)].b_number.y == 1
+    instruction = warrior.instructions[origin]
+    assert instruction.stepping == STEP_VERTICAL
+    assert isinstance(instruction.b_number, Point2D)
+    assert instruction.b_number.x == 0
+    assert instruction.b_number.y == 1
     
     # Test D (normal)
     warrior = parse(['MOV.I.D #0, 0'])
-    assert warrior.instructions[Point2D(0, 0)].stepping == STEP_NORMAL
+    assert warrior.instructions[origin].stepping == STEP_NORMAL
 
 def test_instruction_string_representation():
     # Test default stepping (no modifier shown)
@@ -58,12 +62,13 @@ def test_point2d_arithmetic():
         'ADD.I.Q #1:1, 2:2'
     ])
     
-    assert isinstance(warrior.instructions[Point2D(0, 0)].a_number, Point2D)
-    assert warrior.instructions[Point2D(0, 0)].a_number.x == 1
-    assert warrior.instructions[Point2D(0, 0)].a_number.y == 2
-    assert isinstance(warrior.instructions[Point2D(0, 0)].b_number, Point2D)
-    assert warrior.instructions[Point2D(0, 0)].b_number.x == 3
-    assert warrior.instructions[Point2D(0, 0)].b_number.y == 4
+    instruction = warrior.instructions[Point2D(0, 0)]
+    assert isinstance(instruction.a_number, Point2D)
+    assert instruction.a_number.x == 1
+    assert instruction.a_number.y == 2
+    assert isinstance(instruction.b_number, Point2D)
+    assert instruction.b_number.x == 3
+    assert instruction.b_number.y == 4
 
 def test_invalid_stepping_modifier():
     # Test invalid stepping modifier
@@ -96,100 +101,44 @@ def test_stepping_with_labels():
     assert warrior.labels['target'] == Point2D(0, -1)
     assert warrior.labels['start'] == Point2D(0, 0)
 
-def test_stepping_execution():
-    """Test that stepping modes correctly update the PC during execution."""
-    # Create a simple warrior with different stepping modes
-    warrior = parse([
+    # Label references are relative to the referencing instruction
+    assert warrior.instructions[Point2D(0, 0)].b_number == Point2D(0, -1)
+    assert warrior.instructions[Point2D(0, -1)].b_number == Point2D(0, 1)
+
+@pytest.mark.parametrize('source', [
+    [
         'MOV.I.D #0, 0',      # Normal stepping
         'MOV.I.S #0, 0',      # Vertical stepping
         'MOV.I.Q #0, 0',      # Backward stepping
         'MOV.I.W #0, 0',      # Vertical backward stepping
-    ])
-    
-    # Create a MARS instance with the warrior
-    mars = MARS(warriors=[warrior], randomize=False)
-    
-    # Execute first instruction (D - normal stepping)
-    mars.step()
-    assert len(warrior.task_queue) == 1
-    assert warrior.task_queue[0] == Point2D(1, 0)  # PC+1
-    
-    # Execute second instruction (S - vertical stepping)
-    mars.step()
-    assert len(warrior.task_queue) == 1
-    assert warrior.task_queue[0] == Point2D(1, 1)  # PC+(0:1)
-    
-    # Execute third instruction (Q - backward stepping)
-    mars.step()
-    assert len(warrior.task_queue) == 1
-    assert warrior.task_queue[0] == Point2D(0, 1)  # PC-1
-    
-    # Execute fourth instruction (W - vertical backward stepping)
-    mars.step()
-    assert len(warrior.task_queue) == 1
-    assert warrior.task_queue[0] == Point2D(0, 0)  # PC-(0:1)
-
-def test_stepping_with_jumps():
-    """Test stepping modes with jump instructions."""
-    warrior = parse([
+    ],
+    [
         'JMP.D 1',           # Normal stepping jump
         'JMP.S 0:1',         # Vertical stepping jump
         'JMP.Q -1',          # Backward stepping jump
         'JMP.W 0:-1',        # Vertical backward stepping jump
-    ])
-    
-    mars = MARS(warriors=[warrior], randomize=False)
-    
-    # Execute first instruction (D - normal stepping)
-    mars.step()
-    assert len(warrior.task_queue) == 1
-    assert warrior.task_queue[0] == Point2D(1, 0)  # Jump to PC+1
-    
-    # Execute second instruction (S - vertical stepping)
-    mars.step()
-    assert len(warrior.task_queue) == 1
-    assert warrior.task_queue[0] == Point2D(1, 1)  # Jump to PC+(0:1)
-    
-    # Execute third instruction (Q - backward stepping)
-    mars.step()
-    assert len(warrior.task_queue) == 1
-    assert warrior.task_queue[0] == Point2D(0, 1)  # Jump to PC-1
-    
-    # Execute fourth instruction (W - vertical backward stepping)
-    mars.step()
-    assert len(warrior.task_queue) == 1
-    assert warrior.task_queue[0] == Point2D(0, 0)  # Jump to PC-(0:1)
-
-def test_stepping_with_conditional_jumps():
-    """Test stepping modes with conditional jump instructions."""
-    warrior = parse([
+    ],
+    [
         'JMZ.D #0, 1',       # Normal stepping conditional jump
         'JMZ.S #0, 0:1',     # Vertical stepping conditional jump
         'JMZ.Q #0, -1',      # Backward stepping conditional jump
         'JMZ.W #0, 0:-1',    # Vertical backward stepping conditional jump
-    ])
-    
-    mars = MARS(warriors=[warrior], randomize=False)
-    
-    # Execute first instruction (D - normal stepping)
-    mars.step()
-    assert len(warrior.task_queue) == 1
-    assert warrior.task_queue[0] == Point2D(1, 0)  # Jump to PC+1
-    
-    # Execute second instruction (S - vertical stepping)
-    mars.step()
-    assert len(warrior.task_queue) == 1
-    assert warrior.task_queue[0] == Point2D(1, 1)  # Jump to PC+(0:1)
-    
-    # Execute third instruction (Q - backward stepping)
-    mars.step()
-    assert len(warrior.task_queue) == 1
-    assert warrior.task_queue[0] == Point2D(0, 1)  # Jump to PC-1
-    
-    # Execute fourth instruction (W - vertical backward stepping)
-    mars.step()
-    assert len(warrior.task_queue) == 1
-    assert warrior.task_queue[0] == Point2D(0, 0)  # Jump to PC-(0:1)
+    ],
+], ids=['execution', 'jumps', 'conditional_jumps'])
+def test_stepping_execution(source):
+    """Test that stepping modes correctly update the PC during execution,
+       for plain instructions as well as (conditional) jumps."""
+    warrior = parse(source)
+
+    # Only a handful of cells are touched, so a small core will do
+    mars = MARS(core=Core(size=100, width=10), warriors=[warrior],
+                randomize=False)
+
+    # D steps PC+1, S steps PC+(0:1), Q steps PC-1, W steps PC-(0:1)
+    for expected in (Point2D(1, 0), Point2D(1, 1), Point2D(0, 1), Point2D(0, 0)):
+        mars.step()
+        assert len(warrior.task_queue) == 1
+        assert warrior.task_queue[0] == expected
 
 
 def test_instruction_overlap_detection():
@@ -233,6 +182,15 @@ def test_2d_warrior_size():
     ])
     assert warrior.get_size() == Point2D(3, 3)
 
+    # Bounds follow changes to the instructions
+    warrior.instructions[Point2D(2, 5)] = Instruction('DAT', 'F', None, '#', 0, '#', 0)
+    assert warrior.get_bounds() == (Point2D(-1, 0), Point2D(2, 5))
+    del warrior.instructions[Point2D(2, 5)]
+    assert warrior.get_size() == Point2D(3, 3)
+    instructions = warrior.instructions
+    instructions |= {Point2D(5, 5): Instruction('DAT', 'F', None, '#', 0, '#', 0)}
+    assert warrior.get_bounds() == (Point2D(-1, 0), Point2D(5, 5))
+
 def test_2d_instruction_iteration():
     """Test that iterating over warrior instructions works correctly."""
     warrior = parse([
@@ -242,12 +200,10 @@ def test_2d_instruction_iteration():
         'MOV.I.W #0, 0',  # (-1,0)
     ])
     
-    # Test iteration
-    instructions = list(warrior)
-    assert len(instructions) == 4
+    assert len(warrior) == 4
     
-    # Test that all instructions are present
-    positions = set(warrior.instructions.keys())
+    # Test that iteration yields every position
+    positions = {pos for pos, instruction in warrior}
     assert positions == {Point2D(0, 0), Point2D(1, 0), Point2D(1, 1), Point2D(0, 1)}
     
     # Test that each position has an instruction
@@ -271,7 +227,8 @@ def test_stepping_increment_decrement():
         """Test pre-decrement operation with given stepping mode."""
         # Create fresh warrior and MARS instance
         warrior = create_test_warrior()
-        mars = MARS(warriors=[warrior], randomize=False)
+        mars = MARS(core=Core(size=100, width=10), warriors=[warrior],
+                    randomize=False)
         mars.step()   # over NOP
         
         # Get our test and target instructions